@@ -0,0 +1,53 @@
+import calendar
+from datetime import date, timedelta
+
+from Scripts.Analytics.work_log import DayNumber
+
+COMPARISONS = (
+    "This Week vs Last Week",
+    "This Month vs Last Month",
+    "This Month vs Same Month Last Year",
+    "This Year vs Last Year",
+)
+
+
+def _ShiftMonths(day: date, months):
+    """Same day of the month, months later (clamped to the month's length)"""
+    index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def ComparisonRanges(comparison, today: date):
+    """((current start, current end), (previous start, previous end)) as dates.
+
+    The current period runs up to today and is compared with the same stretch of
+    the previous period, so a half-finished week is not measured against a full one.
+    """
+    if comparison == "This Week vs Last Week":
+        start = today - timedelta(days=today.weekday())
+        return (start, today), (start - timedelta(days=7), today - timedelta(days=7))
+    if comparison == "This Month vs Last Month":
+        start = today.replace(day=1)
+        return (start, today), (_ShiftMonths(start, -1), _ShiftMonths(today, -1))
+    if comparison == "This Month vs Same Month Last Year":
+        start = today.replace(day=1)
+        return (start, today), (_ShiftMonths(start, -12), _ShiftMonths(today, -12))
+    if comparison == "This Year vs Last Year":
+        start = today.replace(month=1, day=1)
+        return (start, today), (_ShiftMonths(start, -12), _ShiftMonths(today, -12))
+    raise ValueError(f"Unknown comparison: {comparison}")
+
+
+def ComparePeriods(index, comparison, today: date):
+    """Per key (current ms, previous ms) for a comparison, from a RangeIndex"""
+    (currentStart, currentEnd), (previousStart, previousEnd) = ComparisonRanges(comparison, today)
+    keys = index.allKeys()
+    current = index.totals(keys, DayNumber(currentStart), DayNumber(currentEnd))
+    previous = index.totals(keys, DayNumber(previousStart), DayNumber(previousEnd))
+    return {
+        int(key): (int(cur), int(prev))
+        for key, cur, prev in zip(keys, current, previous)
+        if cur or prev
+    }
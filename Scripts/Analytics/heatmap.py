@@ -0,0 +1,121 @@
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from Scripts.Analytics.sessions import GetSessionLog
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+HOUR_MS = 3600 * 1000
+# 1970-01-01, day 0 of the epoch, was a Thursday
+EPOCH_WEEKDAY = 3
+
+
+def _UtcOffsetMs(ms):
+    return time.localtime(ms // 1000).tm_gmtoff * 1000
+
+def UtcOffsetsMs(timestamps):
+    """Local UTC offset at each ms timestamp, looked up once per UTC day unless the offset changes that day"""
+    days = timestamps // (24 * HOUR_MS)
+    uniqueDays, dayIndex = np.unique(days, return_inverse=True)
+    dayStarts = np.array([_UtcOffsetMs(day * 24 * HOUR_MS) for day in uniqueDays.tolist()], np.int64)
+    dayEnds = np.array([_UtcOffsetMs((day + 1) * 24 * HOUR_MS - 1) for day in uniqueDays.tolist()], np.int64)
+    offsets = dayStarts[dayIndex]
+    changing = np.flatnonzero((dayStarts != dayEnds)[dayIndex])
+    offsets[changing] = [_UtcOffsetMs(ms) for ms in timestamps[changing].tolist()]
+    return offsets
+
+
+class WeekHeatmap:
+    """Ms of focus per (weekday, hour of day) in local time, one 7x24 grid per category.
+
+    The grids are filled once from the session log and then adjusted as sessions
+    close, so drawing never has to walk the history.
+    """
+
+    def __init__(self, sessionLog):
+        self.sessionLog = sessionLog
+        self.grids = {}
+        # Bumped on every change so views can skip redrawing an unchanged grid
+        self.version = 0
+        self.rebuild()
+        sessionLog.observe(self.onSessionsChanged)
+
+    def rebuild(self):
+        self.grids = {}
+        size = self.sessionLog.size
+        self._apply(self.sessionLog.starts[:size], self.sessionLog.ends[:size], self.sessionLog.categories[:size], 1)
+
+    def onSessionsChanged(self, kind, starts, ends, categoryIds):
+        if kind == "reset":
+            self.rebuild()
+        else:
+            self._apply(starts, ends, categoryIds, 1 if kind == "add" else -1)
+
+    def _apply(self, starts, ends, categoryIds, sign):
+        starts = np.asarray(starts, np.int64)
+        ends = np.asarray(ends, np.int64)
+        categoryIds = np.asarray(categoryIds)
+        # A session crossing a DST change keeps the slower walk over local datetimes
+        startOffsets = UtcOffsetsMs(starts)
+        endOffsets = UtcOffsetsMs(ends)
+        steady = startOffsets == endOffsets
+        self._applySlots(starts[steady] + startOffsets[steady], ends[steady] + startOffsets[steady], categoryIds[steady], sign)
+        for startMs, endMs, categoryId in zip(starts[~steady].tolist(), ends[~steady].tolist(), categoryIds[~steady].tolist()):
+            self._applyWalk(startMs, endMs, categoryId, sign)
+        self.version += 1
+
+    def _grid(self, categoryId):
+        grid = self.grids.get(categoryId)
+        if grid is None:
+            grid = self.grids[categoryId] = np.zeros((7, 24), np.int64)
+        return grid
+
+    def _applySlots(self, localStarts, localEnds, categoryIds, sign):
+        """Spread sessions given in local wall-clock ms over every hour slot they touch"""
+        firstHours = localStarts // HOUR_MS
+        slotCounts = np.where(localEnds > localStarts, (localEnds - 1) // HOUR_MS - firstHours + 1, 0)
+        total = int(slotCounts.sum())
+        if total == 0:
+            return
+        # One entry per (session, hour slot), the slot counted from the session's first hour
+        session = np.repeat(np.arange(len(slotCounts)), slotCounts)
+        hours = firstHours[session] + np.arange(total) - np.repeat(np.cumsum(slotCounts) - slotCounts, slotCounts)
+        slotMs = (np.minimum((hours + 1) * HOUR_MS, localEnds[session])
+                  - np.maximum(hours * HOUR_MS, localStarts[session]))
+        weekdays = (hours // 24 + EPOCH_WEEKDAY) % 7
+
+        keys, keyIndex = np.unique(categoryIds, return_inverse=True)
+        grids = np.zeros((len(keys), 7, 24), np.int64)
+        np.add.at(grids, (keyIndex[session], weekdays, hours % 24), sign * slotMs)
+        for categoryId, grid in zip(keys.tolist(), grids):
+            self._grid(categoryId)[:] += grid
+
+    def _applyWalk(self, startMs, endMs, categoryId, sign):
+        grid = self._grid(categoryId)
+        # Walk the session one local hour slot at a time
+        current = datetime.fromtimestamp(startMs / 1000)
+        end = datetime.fromtimestamp(endMs / 1000)
+        while current < end:
+            slotEnd = min(current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1), end)
+            grid[current.weekday(), current.hour] += sign * round((slotEnd - current).total_seconds() * 1000)
+            current = slotEnd
+
+    def grid(self, categoryIds=None):
+        """7x24 ms grid summed over the given categories, or over all of them"""
+        total = np.zeros((7, 24), np.int64)
+        for categoryId, grid in self.grids.items():
+            if categoryIds is None or categoryId in categoryIds:
+                total += grid
+        return total
+
+
+_HEATMAP = None
+
+def GetHeatmap():
+    """The shared heatmap, kept in sync with the shared session log"""
+    global _HEATMAP
+    if _HEATMAP is None:
+        _HEATMAP = WeekHeatmap(GetSessionLog())
+    return _HEATMAP
@@ -0,0 +1,100 @@
+import numpy as np
+
+from Scripts.Analytics.work_log import GetWorkLog
+
+# Keys and days are packed into one sortable int64, key in the high bits
+_DAY_BITS = 32
+
+
+class RangeIndex:
+    """Cumulative ms over day numbers for every category or every task.
+
+    Rows are sorted by (key, day) and summed once, so the total of any key over
+    any [start, end] is two searchsorted lookups and a subtraction. Rows the work
+    log appends are merged into the sorted keys at the next query; only a reset,
+    a removal or a move (published as a removal then an addition) sorts it all again.
+    """
+
+    def __init__(self, workLog, column):
+        self.workLog = workLog
+        self.column = column
+        self.stale = True
+        # (keys, days, ms) of rows appended since the last query
+        self.pending = []
+        self.keys = np.empty(0, np.int64)
+        self.ms = np.empty(0, np.int64)
+        self.cumulative = np.zeros(1, np.int64)
+        workLog.observe(self.onWorkLogChanged)
+
+    def onWorkLogChanged(self, kind, days, categoryIds, ms, taskIds):
+        if kind == "add" and not self.stale:
+            keys = taskIds if self.column == "tasks" else categoryIds
+            self.pending.append((np.asarray(keys, np.int64), np.asarray(days, np.int64), np.asarray(ms, np.int64)))
+        else:
+            self.stale = True
+            self.pending.clear()
+
+    def _refresh(self):
+        if self.stale:
+            self._rebuild()
+        elif self.pending:
+            self._merge()
+
+    def _rebuild(self):
+        size = self.workLog.size
+        keys = getattr(self.workLog, self.column)[:size]
+        days = self.workLog.days[:size]
+        order = np.lexsort((days, keys))
+        self.keys = (keys[order] << _DAY_BITS) | days[order]
+        self.ms = self.workLog.ms[:size][order]
+        self._accumulate()
+        self.stale = False
+        self.pending.clear()
+
+    def _merge(self):
+        keys, days, ms = (np.concatenate(column) for column in zip(*self.pending))
+        self.pending.clear()
+        packed = (keys << _DAY_BITS) | days
+        order = np.argsort(packed, kind="stable")
+        packed, ms = packed[order], ms[order]
+        positions = np.searchsorted(self.keys, packed, "right")
+        self.keys = np.insert(self.keys, positions, packed)
+        self.ms = np.insert(self.ms, positions, ms)
+        self._accumulate()
+
+    def _accumulate(self):
+        self.cumulative = np.zeros(len(self.ms) + 1, np.int64)
+        np.cumsum(self.ms, out=self.cumulative[1:])
+
+    def total(self, key, startDay, endDay):
+        """Total ms of one key over the days [startDay, endDay]"""
+        totals = self.totals([key], startDay, endDay)
+        return int(totals[0])
+
+    def totals(self, keys, startDay, endDay):
+        """Total ms of each key over the days [startDay, endDay], vectorized"""
+        self._refresh()
+        keys = np.asarray(keys, np.int64) << _DAY_BITS
+        lo = np.searchsorted(self.keys, keys | startDay, "left")
+        hi = np.searchsorted(self.keys, keys | endDay, "right")
+        return self.cumulative[hi] - self.cumulative[lo]
+
+    def allKeys(self):
+        self._refresh()
+        return np.unique(self.keys >> _DAY_BITS)
+
+
+_CATEGORY_INDEX = None
+_TASK_INDEX = None
+
+def GetCategoryIndex():
+    global _CATEGORY_INDEX
+    if _CATEGORY_INDEX is None:
+        _CATEGORY_INDEX = RangeIndex(GetWorkLog(), "categories")
+    return _CATEGORY_INDEX
+
+def GetTaskIndex():
+    global _TASK_INDEX
+    if _TASK_INDEX is None:
+        _TASK_INDEX = RangeIndex(GetWorkLog(), "tasks")
+    return _TASK_INDEX
@@ -0,0 +1,43 @@
+import heapq
+from datetime import date
+
+import numpy as np
+
+from Scripts.Analytics.range_index import GetCategoryIndex, GetTaskIndex
+from Scripts.Analytics.work_log import DayNumber
+
+
+def TopN(index, startDay, endDay, n, live=None):
+    """The n keys with the most time over [startDay, endDay] as [(key, ms)], largest first.
+
+    Totals come from the prefix-sum index in one vectorized pass, live adds time
+    not yet in the index (the running session) and only keys with time enter the
+    bounded heap.
+    """
+    keys = index.allKeys()
+    totals = index.totals(keys, startDay, endDay)
+    hits = np.flatnonzero(totals)
+    candidates = dict(zip(keys[hits].tolist(), totals[hits].tolist()))
+    for key, ms in (live or {}).items():
+        candidates[key] = candidates.get(key, 0) + ms
+    return heapq.nlargest(n, candidates.items(), key=lambda item: item[1])
+
+
+def _LiveMs(activeTasks, startDay, endDay, keyOf):
+    """Uncommitted ms of the running sessions, if today is inside the range"""
+    live = {}
+    if startDay <= DayNumber(date.today()) <= endDay:
+        for task in activeTasks:
+            key = keyOf(task)
+            live[key] = live.get(key, 0) + task.pendingMs
+    return live
+
+
+def TopTasks(startDay, endDay, n, activeTasks=()):
+    live = _LiveMs(activeTasks, startDay, endDay, lambda task: task.id)
+    return TopN(GetTaskIndex(), startDay, endDay, n, live)
+
+
+def TopCategories(startDay, endDay, n, activeTasks=()):
+    live = _LiveMs(activeTasks, startDay, endDay, lambda task: task.categoryId)
+    return TopN(GetCategoryIndex(), startDay, endDay, n, live)
@@ -0,0 +1,134 @@
+from bisect import bisect_left, bisect_right, insort
+from threading import Lock
+
+import numpy as np
+
+from Scripts.Analytics.work_log import GetWorkLog, GRANULARITIES, BucketStarts, NextBucketStart
+
+
+class CategoryRollup:
+    """Totals of one category for every bucket of one granularity"""
+
+    def __init__(self):
+        # Bucket start days kept sorted so a range is two bisects
+        self.starts = []
+        self.totals = {}
+
+    def add(self, bucketStart, ms):
+        if bucketStart not in self.totals:
+            insort(self.starts, bucketStart)
+            self.totals[bucketStart] = 0
+        self.totals[bucketStart] += ms
+
+    def range(self, firstStart, lastStart):
+        """(start, ms) of the buckets starting within [firstStart, lastStart]"""
+        lo = bisect_left(self.starts, firstStart)
+        hi = bisect_right(self.starts, lastStart)
+        return [(start, self.totals[start]) for start in self.starts[lo:hi]]
+
+    def sum(self, firstStart, lastStart):
+        return sum(ms for _, ms in self.range(firstStart, lastStart))
+
+
+class RollupCache:
+    """Per category totals at every "Group by" granularity, updated as work is logged.
+
+    Reading a range costs the number of buckets it spans, however much history exists.
+    Updates and reads take a lock, so aggregation can run off the GUI thread.
+    """
+
+    def __init__(self, workLog):
+        self.workLog = workLog
+        self.lock = Lock()
+        self.rollups = {granularity: {} for granularity in GRANULARITIES}
+        self.rebuild()
+        workLog.observe(self.onWorkLogChanged)
+
+    def rebuild(self):
+        with self.lock:
+            self._rebuild()
+
+    def _rebuild(self):
+        self.rollups = {granularity: {} for granularity in GRANULARITIES}
+        size = self.workLog.size
+        if not size:
+            return
+        # Seed every granularity from one vectorized pass over the whole log
+        days = self.workLog.days[:size]
+        for granularity in GRANULARITIES:
+            bucketStarts, categoryIds, totals = self.workLog.aggregate(int(days.min()), int(days.max()), granularity)
+            for row, categoryId in enumerate(categoryIds.tolist()):
+                filled = np.flatnonzero(totals[row])
+                rollup = CategoryRollup()
+                rollup.starts = bucketStarts[filled].tolist()
+                rollup.totals = dict(zip(rollup.starts, totals[row, filled].astype(np.int64).tolist()))
+                self.rollups[granularity][categoryId] = rollup
+
+    def onWorkLogChanged(self, kind, days, categoryIds, ms, taskIds):
+        if kind == "reset":
+            self.rebuild()
+        elif len(days):
+            with self.lock:
+                self._apply(days, categoryIds, ms if kind == "add" else -ms)
+
+    def _apply(self, days, categoryIds, ms):
+        for granularity in GRANULARITIES:
+            buckets = BucketStarts(days, granularity)
+            # Collapse rows to one update per (category, bucket) before touching the lists
+            keys, index = np.unique(np.stack((categoryIds, buckets)), axis=1, return_inverse=True)
+            totals = np.bincount(index.ravel(), weights=ms, minlength=keys.shape[1])
+            rollups = self.rollups[granularity]
+            for (categoryId, bucketStart), total in zip(keys.T.tolist(), totals.tolist()):
+                if categoryId not in rollups:
+                    rollups[categoryId] = CategoryRollup()
+                rollups[categoryId].add(bucketStart, int(total))
+
+    def aggregate(self, startDay, endDay, granularity, cancelled=None):
+        """Total ms per category and bucket over [startDay, endDay].
+
+        Same shape as WorkLog.aggregate. Buckets cut by the range edges are
+        summed from the day rollup so they only count days inside the range.
+        cancelled is polled between categories, None is returned once it is true.
+        """
+        firstBucket = int(BucketStarts([startDay], granularity)[0])
+        lastBucket = int(BucketStarts([endDay], granularity)[0])
+
+        perCategory = {}
+        with self.lock:
+            dayRollups = self.rollups["Day"]
+            for categoryId, rollup in self.rollups[granularity].items():
+                if cancelled is not None and cancelled():
+                    return None
+                values = self._categoryRange(rollup, dayRollups[categoryId], firstBucket, lastBucket, startDay, endDay, granularity)
+                if values:
+                    perCategory[categoryId] = values
+
+        bucketStarts = np.array(sorted({start for values in perCategory.values() for start in values}), np.int64)
+        categoryIds = np.array(sorted(perCategory), np.int64)
+        columns = {start: i for i, start in enumerate(bucketStarts.tolist())}
+        totals = np.zeros((len(categoryIds), len(bucketStarts)))
+        for row, categoryId in enumerate(categoryIds.tolist()):
+            for start, ms in perCategory[categoryId].items():
+                totals[row, columns[start]] = ms
+        return bucketStarts, categoryIds, totals
+
+    @staticmethod
+    def _categoryRange(rollup, dayRollup, firstBucket, lastBucket, startDay, endDay, granularity):
+        values = dict(rollup.range(firstBucket, lastBucket))
+        if granularity != "Day":
+            for edge in {firstBucket, lastBucket}:
+                if edge in values:
+                    first = max(edge, startDay)
+                    last = min(NextBucketStart(edge, granularity) - 1, endDay)
+                    values[edge] = dayRollup.sum(first, last)
+        return {start: ms for start, ms in values.items() if ms > 0}
+
+
+_ROLLUP = None
+
+def GetRollup():
+    """The shared rollup cache, kept in sync with the shared work log"""
+    global _ROLLUP
+    if _ROLLUP is None:
+        _ROLLUP = RollupCache(GetWorkLog())
+    return _ROLLUP
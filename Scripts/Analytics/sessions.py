@@ -0,0 +1,188 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+import Scripts.Tasks.task_manager as task_manager
+
+
+def LocalMs(day: date, minutes):
+    """Ms since the epoch of a local wall-clock time, minutes after midnight on day"""
+    moment = datetime(day.year, day.month, day.day) + timedelta(minutes=minutes)
+    return int(moment.timestamp() * 1000)
+
+
+class SessionLog:
+    """Every focus session as a (start, end) interval in ms since the epoch.
+
+    Sessions are kept sorted by start alongside a running maximum of their ends.
+    The sessions overlapping [a, b) are then the contiguous slice between the first
+    running maximum past a and the last start before b, so stabbing and range
+    queries cost two binary searches plus the sessions actually returned.
+    """
+
+    def __init__(self, capacity=1024):
+        self.starts = np.empty(capacity, np.int64)
+        self.ends = np.empty(capacity, np.int64)
+        self.tasks = np.empty(capacity, np.int64)
+        self.categories = np.empty(capacity, np.int64)
+        self.size = 0
+        self.sorted = True
+        self.maxEnds = np.empty(0, np.int64)
+        self.maxEndsValid = False
+        # Row of each task's latest session, so a checkpointed span can extend it
+        self.lastRow = {}
+        # Callbacks of the form callback(kind, starts, ends, categoryIds) told about every
+        # interval added or removed, kind is "add", "remove" or "reset"
+        self.observers = []
+
+    def observe(self, callback):
+        self.observers.append(callback)
+
+    def _publish(self, kind, starts=None, ends=None, categoryIds=None):
+        for callback in self.observers:
+            callback(kind, starts, ends, categoryIds)
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        if needed <= len(self.starts):
+            return
+        capacity = max(needed, len(self.starts) * 2)
+        for name in ("starts", "ends", "tasks", "categories"):
+            column = np.empty(capacity, np.int64)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+
+    def add(self, startMs, endMs, taskId, categoryId):
+        row = self.lastRow.get(taskId)
+        if row is not None and self.ends[row] == startMs:
+            self.ends[row] = endMs
+        else:
+            self._reserve(1)
+            row = self.size
+            if row and startMs < self.starts[row - 1]:
+                self.sorted = False
+            self.starts[row] = startMs
+            self.ends[row] = endMs
+            self.tasks[row] = taskId
+            self.categories[row] = categoryId
+            self.size += 1
+            self.lastRow[taskId] = row
+        self.maxEndsValid = False
+        self._publish("add", [startMs], [endMs], [categoryId])
+
+    def rebuild(self, tasks):
+        starts, ends, taskIds, categoryIds = [], [], [], []
+        for task in tasks:
+            for start, end in task.sessions:
+                starts.append(start)
+                ends.append(end)
+            taskIds.append(np.full(len(task.sessions), task.id, np.int64))
+            categoryIds.append(np.full(len(task.sessions), task.categoryId, np.int64))
+        self.size = 0
+        self._reserve(len(starts))
+        self.size = len(starts)
+        if starts:
+            self.starts[:self.size] = starts
+            self.ends[:self.size] = ends
+            self.tasks[:self.size] = np.concatenate(taskIds)
+            self.categories[:self.size] = np.concatenate(categoryIds)
+        self.sorted = False
+        self._ensureSorted()
+        self._publish("reset")
+
+    def moveTask(self, taskId, categoryId):
+        rows = self.tasks[:self.size] == taskId
+        starts, ends = self.starts[:self.size][rows], self.ends[:self.size][rows]
+        self._publish("remove", starts, ends, self.categories[:self.size][rows])
+        self.categories[:self.size][rows] = categoryId
+        self._publish("add", starts, ends, np.full(len(starts), categoryId, np.int64))
+
+    def removeTask(self, taskId):
+        keep = self.tasks[:self.size] != taskId
+        removed = ~keep
+        self._publish("remove", self.starts[:self.size][removed], self.ends[:self.size][removed], self.categories[:self.size][removed])
+        count = int(keep.sum())
+        for name in ("starts", "ends", "tasks", "categories"):
+            column = getattr(self, name)
+            column[:count] = column[:self.size][keep]
+        self.size = count
+        self._reindex()
+
+    def _reindex(self):
+        self.lastRow = {int(taskId): row for row, taskId in enumerate(self.tasks[:self.size].tolist())}
+        self.maxEndsValid = False
+
+    def _ensureSorted(self):
+        if not self.sorted:
+            order = np.argsort(self.starts[:self.size], kind="stable")
+            for name in ("starts", "ends", "tasks", "categories"):
+                column = getattr(self, name)
+                column[:self.size] = column[:self.size][order]
+            self.sorted = True
+            self._reindex()
+        if not self.maxEndsValid:
+            self.maxEnds = np.maximum.accumulate(self.ends[:self.size])
+            self.maxEndsValid = True
+
+    def _overlapping(self, a, b):
+        """Slice bounds of the rows that may overlap [a, b)"""
+        self._ensureSorted()
+        lo = np.searchsorted(self.maxEnds, a, "right")
+        hi = np.searchsorted(self.starts[:self.size], b, "left")
+        return lo, max(lo, hi)
+
+    def activeAt(self, atMs):
+        """Ids of the tasks that were focused at the given moment"""
+        lo, hi = self._overlapping(atMs, atMs + 1)
+        hits = self.ends[lo:hi] > atMs
+        return sorted(set(self.tasks[lo:hi][hits].tolist()))
+
+    def overlapTotals(self, a, b, by="categories"):
+        """Ms of focus falling inside [a, b), as {category or task id: ms}"""
+        lo, hi = self._overlapping(a, b)
+        overlap = np.minimum(self.ends[lo:hi], b) - np.maximum(self.starts[lo:hi], a)
+        keys = getattr(self, by)[lo:hi]
+        hits = overlap > 0
+        totals = {}
+        for key, ms in zip(keys[hits].tolist(), overlap[hits].tolist()):
+            totals[key] = totals.get(key, 0) + ms
+        return totals
+
+    def timeOfDayTotals(self, startDay: date, endDay: date, fromMinutes, toMinutes, by="categories"):
+        """Ms of focus within the same daily window (local time) on every day of a range.
+
+        For example 09:00 to 12:00 over the last quarter is fromMinutes=540, toMinutes=720.
+        """
+        totals = {}
+        day = startDay
+        while day <= endDay:
+            window = self.overlapTotals(LocalMs(day, fromMinutes), LocalMs(day, toMinutes), by)
+            for key, ms in window.items():
+                totals[key] = totals.get(key, 0) + ms
+            day += timedelta(days=1)
+        return totals
+
+    def onEvent(self, event, data):
+        if event == "Loaded":
+            self.rebuild(task_manager.GetTasks())
+        elif event == "TaskWorked" and "Start" in data:
+            categoryId = data.get("Category")
+            if categoryId is None:
+                categoryId = task_manager.GetTask(data["Id"]).categoryId
+            self.add(data["Start"], data["End"], data["Id"], categoryId)
+        elif event == "TaskMoved":
+            self.moveTask(data["Id"], data["Category"])
+        elif event == "TaskDeleted":
+            self.removeTask(data["Id"])
+
+
+_SESSION_LOG = None
+
+def GetSessionLog():
+    """The shared session log, built from task_manager on first use and kept in sync after"""
+    global _SESSION_LOG
+    if _SESSION_LOG is None:
+        _SESSION_LOG = SessionLog()
+        _SESSION_LOG.rebuild(task_manager.GetTasks())
+        task_manager.Subscribe(_SESSION_LOG.onEvent)
+    return _SESSION_LOG
@@ -0,0 +1,234 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+import Scripts.Tasks.task_manager as task_manager
+
+GRANULARITIES = ("Day", "Week", "Month", "Year")
+_EPOCH = date(1970, 1, 1)
+
+
+def DayNumber(day: date):
+    """Days since 1970-01-01, the same scale numpy's datetime64[D] uses"""
+    return (day - _EPOCH).days
+
+def DayFromNumber(dayNumber):
+    return _EPOCH + timedelta(days=int(dayNumber))
+
+def ParseDays(dayStrs):
+    """Vectorized parse of "yyyy-MM-dd" keys, returning (day numbers, mask of keys that parsed)"""
+    dayStrs = list(dayStrs)
+    try:
+        return np.array(dayStrs, dtype="datetime64[D]").astype(np.int64), np.ones(len(dayStrs), bool)
+    except ValueError:
+        days = np.zeros(len(dayStrs), np.int64)
+        valid = np.zeros(len(dayStrs), bool)
+        for i, dayStr in enumerate(dayStrs):
+            try:
+                days[i] = DayNumber(date.fromisoformat(dayStr))
+                valid[i] = True
+            except ValueError:
+                continue
+        return days, valid
+
+def BucketStarts(days, granularity):
+    """Map day numbers to the first day of their day/week/month/year bucket"""
+    days = np.asarray(days, np.int64)
+    if granularity == "Day":
+        return days
+    if granularity == "Week":
+        # 1970-01-01 was a Thursday, weeks start on Monday
+        return days - (days + 3) % 7
+    unit = "M" if granularity == "Month" else "Y"
+    return days.astype("datetime64[D]").astype(f"datetime64[{unit}]").astype("datetime64[D]").astype(np.int64)
+
+def BucketCount(startDay, endDay, granularity):
+    """How many day/week/month/year buckets the days [startDay, endDay] touch"""
+    if endDay < startDay:
+        return 0
+    if granularity == "Day":
+        return endDay - startDay + 1
+    if granularity == "Week":
+        first, last = BucketStarts([startDay, endDay], granularity)
+        return int(last - first) // 7 + 1
+    unit = "M" if granularity == "Month" else "Y"
+    first, last = np.array([startDay, endDay], "datetime64[D]").astype(f"datetime64[{unit}]").astype(np.int64)
+    return int(last - first) + 1
+
+def NextBucketStart(bucketStart, granularity):
+    """First day of the bucket following the one starting on bucketStart"""
+    if granularity == "Day":
+        return bucketStart + 1
+    if granularity == "Week":
+        return bucketStart + 7
+    unit = "M" if granularity == "Month" else "Y"
+    bucket = np.datetime64(int(bucketStart), "D").astype(f"datetime64[{unit}]") + 1
+    return int(bucket.astype("datetime64[D]").astype(np.int64))
+
+
+class WorkLog:
+    """Every dailyWork entry of every task held as parallel NumPy columns.
+
+    Rows are kept sorted by day so a date range is a pair of searchsorted calls.
+    Several rows may share a (task, day) pair; they are simply summed.
+    """
+
+    def __init__(self, capacity=1024):
+        self.days = np.empty(capacity, np.int64)
+        self.tasks = np.empty(capacity, np.int64)
+        self.categories = np.empty(capacity, np.int64)
+        self.ms = np.empty(capacity, np.int64)
+        self.size = 0
+        self.sorted = True
+        # Bumped on every change so dependent caches know when to refresh
+        self.version = 0
+        # Callbacks of the form callback(kind, days, categoryIds, ms, taskIds) told about every
+        # row change, kind is "add", "remove" or "reset" (arrays are None for a reset)
+        self.observers = []
+
+    def observe(self, callback):
+        self.observers.append(callback)
+
+    def _publish(self, kind, days=None, categoryIds=None, ms=None, taskIds=None):
+        for callback in self.observers:
+            callback(kind, days, categoryIds, ms, taskIds)
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        if needed <= len(self.days):
+            return
+        capacity = max(needed, len(self.days) * 2)
+        for name in ("days", "tasks", "categories", "ms"):
+            column = np.empty(capacity, np.int64)
+            column[:self.size] = getattr(self, name)[:self.size]
+            setattr(self, name, column)
+
+    def append(self, days, taskIds, categoryIds, ms):
+        days = np.asarray(days, np.int64)
+        count = len(days)
+        if count == 0:
+            return
+        self._reserve(count)
+        end = self.size + count
+        if np.any(np.diff(days) < 0) or (self.size and days[0] < self.days[self.size - 1]):
+            self.sorted = False
+        self.days[self.size:end] = days
+        self.tasks[self.size:end] = taskIds
+        self.categories[self.size:end] = categoryIds
+        self.ms[self.size:end] = ms
+        self._publish("add", days, self.categories[self.size:end].copy(), self.ms[self.size:end].copy(),
+                      self.tasks[self.size:end].copy())
+        self.size = end
+        self.version += 1
+
+    def addWork(self, taskId, categoryId, dailyWork):
+        days, valid = ParseDays(dailyWork.keys())
+        ms = np.fromiter(dailyWork.values(), np.int64, len(dailyWork))
+        self.append(days[valid], taskId, categoryId, ms[valid])
+
+    def rebuild(self, tasks):
+        observers, self.observers = self.observers, []
+        self.size = 0
+        self.sorted = True
+        keys, ms, taskIds, categoryIds = [], [], [], []
+        for task in tasks:
+            keys.extend(task.dailyWork.keys())
+            ms.extend(task.dailyWork.values())
+            taskIds.append(np.full(len(task.dailyWork), task.id, np.int64))
+            categoryIds.append(np.full(len(task.dailyWork), task.categoryId, np.int64))
+        days, valid = ParseDays(keys)
+        if keys:
+            taskIds = np.concatenate(taskIds)[valid]
+            categoryIds = np.concatenate(categoryIds)[valid]
+            self.append(days[valid], taskIds, categoryIds, np.asarray(ms, np.int64)[valid])
+        self.version += 1
+        self.observers = observers
+        self._publish("reset")
+
+    def moveTask(self, taskId, categoryId):
+        rows = self.tasks[:self.size] == taskId
+        days, ms, taskIds = self.days[:self.size][rows], self.ms[:self.size][rows], self.tasks[:self.size][rows]
+        self._publish("remove", days, self.categories[:self.size][rows], ms, taskIds)
+        self.categories[:self.size][rows] = categoryId
+        self._publish("add", days, np.full(len(days), categoryId, np.int64), ms, taskIds)
+        self.version += 1
+
+    def removeTask(self, taskId):
+        keep = self.tasks[:self.size] != taskId
+        removed = ~keep
+        self._publish("remove", self.days[:self.size][removed], self.categories[:self.size][removed],
+                      self.ms[:self.size][removed], self.tasks[:self.size][removed])
+        count = int(keep.sum())
+        for name in ("days", "tasks", "categories", "ms"):
+            column = getattr(self, name)
+            column[:count] = column[:self.size][keep]
+        self.size = count
+        self.version += 1
+
+    def _ensureSorted(self):
+        if self.sorted:
+            return
+        order = np.argsort(self.days[:self.size], kind="stable")
+        for name in ("days", "tasks", "categories", "ms"):
+            column = getattr(self, name)
+            column[:self.size] = column[:self.size][order]
+        self.sorted = True
+
+    def rowsInRange(self, startDay, endDay):
+        """Slice bounds of the rows falling on days in [startDay, endDay]"""
+        self._ensureSorted()
+        days = self.days[:self.size]
+        return np.searchsorted(days, startDay, "left"), np.searchsorted(days, endDay, "right")
+
+    def aggregate(self, startDay, endDay, granularity):
+        """Total ms per category and bucket over [startDay, endDay].
+
+        Returns (bucket start days, category ids, ms matrix shaped [category, bucket]).
+        """
+        lo, hi = self.rowsInRange(startDay, endDay)
+        if lo == hi:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.zeros((0, 0))
+        # Rows are sorted by day, so bucket starts are already non-decreasing
+        buckets = BucketStarts(self.days[lo:hi], granularity)
+        newBucket = np.empty(len(buckets), bool)
+        newBucket[0] = True
+        np.not_equal(buckets[1:], buckets[:-1], out=newBucket[1:])
+        bucketStarts = buckets[newBucket]
+        bucketIndex = np.cumsum(newBucket) - 1
+        # Category ids are small integers, so a lookup table beats a sort
+        categories = self.categories[lo:hi]
+        categoryIds = np.flatnonzero(np.bincount(categories))
+        lookup = np.zeros(categoryIds[-1] + 1, np.int64)
+        lookup[categoryIds] = np.arange(len(categoryIds))
+        categoryIndex = lookup[categories]
+        totals = np.bincount(
+            categoryIndex * len(bucketStarts) + bucketIndex,
+            weights=self.ms[lo:hi],
+            minlength=len(categoryIds) * len(bucketStarts)
+        )
+        return bucketStarts, categoryIds, totals.reshape(len(categoryIds), len(bucketStarts))
+
+    def onEvent(self, event, data):
+        if event == "Loaded":
+            self.rebuild(task_manager.GetTasks())
+        elif event == "TaskWorked":
+            categoryId = data.get("Category")
+            if categoryId is None:
+                categoryId = task_manager.GetTask(data["Id"]).categoryId
+            self.addWork(data["Id"], categoryId, data["Days"])
+        elif event == "TaskMoved":
+            self.moveTask(data["Id"], data["Category"])
+        elif event == "TaskDeleted":
+            self.removeTask(data["Id"])
+
+
+_WORK_LOG = None
+
+def GetWorkLog():
+    """The shared work log, built from task_manager on first use and kept in sync after"""
+    global _WORK_LOG
+    if _WORK_LOG is None:
+        _WORK_LOG = WorkLog()
+        _WORK_LOG.rebuild(task_manager.GetTasks())
+        task_manager.Subscribe(_WORK_LOG.onEvent)
+    return _WORK_LOG
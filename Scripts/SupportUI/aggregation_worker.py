@@ -0,0 +1,32 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class AggregationSignals(QObject):
+    # (request id, (bucket starts, category ids, ms matrix)), delivered on the GUI thread
+    finished = pyqtSignal(int, object)
+
+
+class AggregationWorker(QRunnable):
+    """Runs one rollup aggregation on a QThreadPool thread.
+
+    Every request carries an id; once a newer request exists the worker gives up
+    at the next category and posts nothing, so stale ranges never reach the chart.
+    """
+
+    def __init__(self, rollup, request_id, latest_request, start_day, end_day, aggregation_type):
+        super().__init__()
+        self.rollup = rollup
+        self.request_id = request_id
+        self.latest_request = latest_request  # Callable returning the newest request id
+        self.start_day = start_day
+        self.end_day = end_day
+        self.aggregation_type = aggregation_type
+        self.signals = AggregationSignals()
+
+    def is_cancelled(self):
+        return self.latest_request() != self.request_id
+
+    def run(self):
+        result = self.rollup.aggregate(self.start_day, self.end_day, self.aggregation_type, self.is_cancelled)
+        if result is not None and not self.is_cancelled():
+            self.signals.finished.emit(self.request_id, result)
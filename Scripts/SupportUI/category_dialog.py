@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QLabel, QHBoxLayout, QButtonGroup, QRadioButton
 )
 from Scripts.Util.colors import COLORS, ColorHex
-from Scripts.Tasks.task_manager import AddCategory
+from Scripts.Tasks.task_manager import AddCategory, EditCategory
 
 class CategoryCreationWindow(QDialog):
     def __init__(self, parent=None):
@@ -66,3 +66,76 @@ class CategoryCreationWindow(QDialog):
         if name:
             self.categoryId = AddCategory(name=name, color=self.selectedColor, description=description)
             self.accept()
+
+
+class CategoryEditDialog(QDialog):
+    def __init__(self, category_id, category_data, parent=None):
+        super().__init__(parent)
+        self.category_id = category_id
+        self.category_data = category_data
+        self.setWindowTitle("Edit Category")
+        self.setFixedSize(350, 350)
+        
+        layout = QVBoxLayout(self)
+        
+        # Category name
+        layout.addWidget(QLabel("Category Name:"))
+        self.name_input = QLineEdit(category_data["Name"])
+        layout.addWidget(self.name_input)
+        
+        # Description
+        layout.addWidget(QLabel("Description:"))
+        self.desc_input = QTextEdit()
+        self.desc_input.setPlainText(category_data["Description"])
+        self.desc_input.setFixedHeight(80)
+        layout.addWidget(self.desc_input)
+        
+        # Color selection
+        layout.addWidget(QLabel("Color:"))
+        color_layout = QHBoxLayout()
+        self.selected_color = category_data["Color"]
+        
+        for color_name in dir(COLORS):
+            if color_name.startswith("__"):
+                continue
+            color_value = getattr(COLORS, color_name)
+            btn = QPushButton()
+            btn.setFixedSize(25, 25)
+            btn.setStyleSheet(f"background-color: {color_value.hex}; border: 2px solid {'white' if color_value == self.selected_color else 'gray'};")
+            btn.clicked.connect(lambda checked, c=color_value: self.select_color(c))
+            color_layout.addWidget(btn)
+        
+        layout.addLayout(color_layout)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(self.save_changes)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(save_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+    
+    def select_color(self, color):
+        self.selected_color = color
+        # Update button styles to show selection
+        # for i in range(self.layout().itemAt(3).layout().count()):
+        #     btn = self.layout().itemAt(3).layout().itemAt(i).widget()
+        #     if btn:
+        #         color_name = list(dir(COLORS))[i + 2]  # Skip __class__ and __module__
+        #         color_value = getattr(COLORS, color_name)
+        #         border_color = 'white' if color_value == self.selected_color else 'gray'
+        #         btn.setStyleSheet(f"background-color: {color_value.hex}; border: 2px solid {border_color};")
+    
+    def save_changes(self):
+        new_name = self.name_input.text().strip()
+        
+        EditCategory(
+            self.category_id,
+            name=new_name or None,
+            description=self.desc_input.toPlainText(),
+            color=self.selected_color
+        )
+        
+        self.accept()
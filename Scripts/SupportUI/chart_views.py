@@ -0,0 +1,63 @@
+import importlib
+from importlib.util import find_spec
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# Renderer name -> (module holding its views, package it needs). Modules are only
+# imported once their renderer is picked, so an unused plotting library never loads.
+CHART_BACKENDS = {
+    "Matplotlib": ("Scripts.SupportUI.mpl_chart_view", "matplotlib"),
+    "PyQtGraph": ("Scripts.SupportUI.pg_chart_view", "pyqtgraph"),
+}
+DEFAULT_CHART_BACKEND = "Matplotlib"
+BAR_WIDTH = 0.8
+
+
+def AvailableBackends():
+    """Renderers whose plotting library is installed, in CHART_BACKENDS order"""
+    return [name for name, (_, package) in CHART_BACKENDS.items() if find_spec(package) is not None]
+
+
+def CreateChartViews(backend, chart):
+    """(bar view, heatmap view) of a renderer, both QWidgets drawing for the given chart"""
+    module = importlib.import_module(CHART_BACKENDS[backend][0])
+    return module.BarView(chart), module.HeatmapView(chart)
+
+
+class BarHitIndex:
+    """Finds the stacked bar segment under a point with two bisects.
+
+    Bars sit at integer positions, so the left edges are sorted; per period the
+    cumulative segment tops are sorted too.
+    """
+
+    def __init__(self):
+        self.lefts = []
+        self.tops = []
+        self.hours = []
+
+    def build(self, hours):
+        """hours is the [category, period] matrix of the drawn bars"""
+        self.lefts = (np.arange(hours.shape[1]) - BAR_WIDTH / 2).tolist()
+        self.tops = np.cumsum(hours, axis=0).T.tolist()
+        self.hours = hours.T.tolist()
+
+    def clear(self):
+        self.lefts = []
+
+    def hit(self, x, y):
+        """(category index, period index) of the segment under (x, y) in data units, or None"""
+        if not self.lefts:
+            return None
+        period = bisect_right(self.lefts, x) - 1
+        if period < 0 or x > self.lefts[period] + BAR_WIDTH or y < 0:
+            return None
+        category = bisect_left(self.tops[period], y)
+        if category >= len(self.tops[period]) or self.hours[period][category] <= 0:
+            return None
+        return category, period
+
+    def value(self, segment):
+        category, period = segment
+        return self.hours[period][category]
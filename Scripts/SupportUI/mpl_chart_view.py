@@ -0,0 +1,305 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.transforms import Bbox
+import numpy as np
+
+from Scripts.Analytics.heatmap import WEEKDAYS
+from Scripts.SupportUI.chart_views import BarHitIndex, BAR_WIDTH
+
+
+class BarView(QWidget):
+    """Stacked bars drawn with matplotlib on an Agg canvas"""
+
+    def __init__(self, chart, parent=None):
+        super().__init__(parent)
+        self.chart = chart  # Supplies colors and formatting
+
+        # Set matplotlib style to match dark theme
+        plt.style.use('dark_background' if chart.is_dark_theme() else 'default')
+
+        self.figure = Figure(figsize=(12, 6), facecolor=chart.background_color)
+        self.canvas = FigureCanvas(self.figure)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+
+        # Connect mouse motion event for tooltips
+        self.canvas.mpl_connect('motion_notify_event', self.on_hover)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+        self.bar_containers = []
+        self.bar_periods = []
+        self.hit_index = BarHitIndex()
+
+        # The tooltip and the live segments are animated artists blitted over a
+        # saved copy of the figure
+        self.tooltip = None
+        self.tooltip_background = None
+        self.tooltip_region = None
+        self.tooltip_segment = None
+        self.live_bars = []
+
+    def build(self, categories, hours, periods, aggregation_type):
+        """Rebuild the axes, bars and legend from scratch"""
+        background_color = self.chart.background_color
+        text_color = self.chart.text_color
+
+        # Clear the previous plot and reset bar segments
+        self.figure.clear()
+        self.bar_containers = []
+        self.hit_index.clear()
+        self.tooltip = None
+        self.tooltip_segment = None
+        self.live_bars = []
+
+        ax = self.figure.add_subplot(111, facecolor=background_color)
+
+        if not periods:
+            ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
+                   transform=ax.transAxes, fontsize=14, color=text_color)
+            self.figure.patch.set_facecolor(background_color)
+            self.canvas.draw()
+            return
+
+        # Periods are placed at integer positions and labelled afterwards
+        self.bar_periods = periods
+        positions = np.arange(len(periods))
+
+        # Create the stacked bar chart
+        bottom = np.zeros(len(periods))
+
+        for (category_id, category, color), values in zip(categories, hours):
+            bars = ax.bar(positions, values, width=BAR_WIDTH, bottom=bottom, label=category,
+                         color=color, alpha=0.8, edgecolor=self.chart.lighten_color(background_color, 30),
+                         linewidth=0.5)
+            self.bar_containers.append((category, bars))
+            bottom += values
+        self.hit_index.build(hours)
+        self.create_tooltip(ax)
+
+        # Customize the chart appearance
+        ax.set_facecolor(background_color)
+        ax.tick_params(colors=text_color)
+        ax.set_ylabel('Hours Worked', fontsize=12, color=text_color)
+        ax.set_xlabel(f'Time Period ({aggregation_type})', fontsize=12, color=text_color)
+        ax.set_title('Task Time Distribution', fontsize=14, fontweight='bold', color=text_color)
+
+        # Rotate x-axis labels for better readability
+        ax.set_xticks(positions)
+        ax.set_xticklabels(periods)
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right', color=text_color)
+
+        # Add legend
+        if categories:
+            legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+            legend.get_frame().set_facecolor(self.chart.lighten_color(background_color, 20))
+            legend.get_frame().set_edgecolor(self.chart.lighten_color(background_color, 40))
+            for text in legend.get_texts():
+                text.set_color(text_color)
+
+        # Add grid for better readability
+        ax.grid(True, alpha=0.2, axis='y', color=text_color)
+        ax.set_axisbelow(True)
+
+        # Set figure background
+        self.figure.patch.set_facecolor(background_color)
+
+        # Adjust layout to prevent label cutoff
+        self.figure.tight_layout()
+
+        # Refresh the canvas
+        self.canvas.draw()
+
+    def update_bars(self, hours):
+        """Resize the existing bar rectangles to new values"""
+        if not self.bar_containers:
+            return
+        bottom = np.zeros(hours.shape[1])
+        for (category, bars), values in zip(self.bar_containers, hours):
+            for bar, value, base in zip(bars, values.tolist(), bottom.tolist()):
+                bar.set_y(base)
+                bar.set_height(value)
+            bottom += values
+        self.hit_index.build(hours)
+        self.tooltip_segment = None
+
+        ax = self.figure.axes[0]
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        self.canvas.draw_idle()
+
+    def update_period(self, hours, period):
+        """Resize only one period's segments, the rest of hours is unchanged"""
+        if not self.bar_containers:
+            return
+        base = 0.0
+        for (category, bars), value in zip(self.bar_containers, hours[:, period].tolist()):
+            bars[period].set_y(base)
+            bars[period].set_height(value)
+            base += value
+        self.hit_index.build(hours)
+        self.tooltip_segment = None
+
+        ax = self.figure.axes[0]
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+        self.canvas.draw_idle()
+
+    def create_tooltip(self, ax):
+        """Create the hidden tooltip annotation, drawn only by blitting"""
+        background_color = self.chart.background_color
+        self.tooltip = ax.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(20, 20), textcoords='offset points',
+            bbox=dict(boxstyle='round,pad=0.5',
+                     facecolor=self.chart.lighten_color(background_color, 40),
+                     edgecolor=self.chart.lighten_color(background_color, 60),
+                     alpha=0.9),
+            fontsize=10,
+            color=self.chart.text_color,
+            ha='left',
+            animated=True,
+            visible=False
+        )
+
+    def set_live(self, period, segments):
+        """Stack the running sessions on a period's bar, segments are [(bottom, hours, color)]
+
+        Only the live rectangles are redrawn, blitted over the rest of the chart.
+        """
+        if self.tooltip is None:
+            return
+        ax = self.figure.axes[0]
+        regions = [bar.get_window_extent() for bar in self.live_bars if bar.get_visible()]
+        while len(self.live_bars) < len(segments):
+            bar = Rectangle((0, 0), BAR_WIDTH, 0, alpha=0.8, linewidth=0.5, animated=True,
+                            edgecolor=self.chart.lighten_color(self.chart.background_color, 30))
+            ax.add_patch(bar)
+            self.live_bars.append(bar)
+        for bar, (bottom, hours, color) in zip(self.live_bars, segments):
+            bar.set_xy((period - BAR_WIDTH / 2, bottom))
+            bar.set_height(hours)
+            bar.set_facecolor(color)
+            bar.set_visible(True)
+        for bar in self.live_bars[len(segments):]:
+            bar.set_visible(False)
+
+        # A bar outgrowing the axes needs new limits and so a full draw
+        top = max((bottom + hours for bottom, hours, _ in segments), default=0)
+        if top > ax.get_ylim()[1]:
+            ax.set_ylim(top=top * 1.05)
+            self.canvas.draw_idle()
+            return
+        regions += [bar.get_window_extent() for bar in self.live_bars if bar.get_visible()]
+        self.blit_overlays(regions)
+
+    def draw_overlays(self):
+        for bar in self.live_bars:
+            if bar.get_visible():
+                self.figure.draw_artist(bar)
+        if self.tooltip is not None and self.tooltip.get_visible():
+            self.figure.draw_artist(self.tooltip)
+            self.tooltip_region = Bbox.union([
+                self.tooltip.get_window_extent(),
+                self.tooltip.get_bbox_patch().get_window_extent()
+            ]).padded(2)
+        else:
+            self.tooltip_region = None
+
+    def on_draw(self, event):
+        """Save the freshly drawn figure for the overlays to be blitted over, then add them"""
+        self.tooltip_background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_overlays()
+
+    def on_hover(self, event):
+        """Handle mouse hover events for tooltips"""
+        segment = None
+        if event.inaxes is not None:
+            segment = self.hit_index.hit(event.xdata, event.ydata)
+        if segment is None:
+            self.hide_tooltip()
+        else:
+            self.show_tooltip(event, segment)
+
+    def show_tooltip(self, event, segment):
+        """Show tooltip with category and hours information"""
+        if self.tooltip is None:
+            return
+        if segment != self.tooltip_segment:
+            category, period = segment
+            hours_text = self.chart.format_hours(self.hit_index.value(segment))
+            self.tooltip.set_text(f"{self.bar_containers[category][0]}\n{hours_text}\n{self.bar_periods[period]}")
+            self.tooltip_segment = segment
+        self.tooltip.xy = (event.xdata, event.ydata)
+        self.tooltip.set_visible(True)
+        self.blit_tooltip()
+
+    def hide_tooltip(self):
+        """Hide the tooltip"""
+        if self.tooltip is not None and self.tooltip.get_visible():
+            self.tooltip.set_visible(False)
+            self.tooltip_segment = None
+            self.blit_tooltip()
+
+    def blit_tooltip(self):
+        """Repaint only the area the tooltip covered and now covers"""
+        self.blit_overlays([])
+
+    def blit_overlays(self, regions):
+        """Redraw the overlays and repaint only the given regions and the tooltip's area"""
+        if self.tooltip_background is None:
+            return
+        regions = list(regions)
+        if self.tooltip_region is not None:
+            regions.append(self.tooltip_region)
+        self.canvas.restore_region(self.tooltip_background)
+        self.draw_overlays()
+        if self.tooltip_region is not None:
+            regions.append(self.tooltip_region)
+        if regions:
+            region = Bbox.intersection(Bbox.union(regions).padded(1), self.figure.bbox)
+            if region is not None:
+                self.canvas.blit(region)
+
+
+class HeatmapView(QWidget):
+    """Weekday by hour of day image drawn with matplotlib"""
+
+    def __init__(self, chart, parent=None):
+        super().__init__(parent)
+        self.chart = chart
+        self.figure = Figure(figsize=(12, 6), facecolor=chart.background_color)
+        self.canvas = FigureCanvas(self.figure)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.canvas)
+
+        # The image is created once and only its data changes afterwards
+        self.image = None
+
+    def draw(self, hours):
+        """Show a 7x24 grid of hours"""
+        text_color = self.chart.text_color
+        if self.image is None:
+            ax = self.figure.add_subplot(111, facecolor=self.chart.background_color)
+            self.image = ax.imshow(hours, aspect='auto', cmap='magma', interpolation='nearest')
+            ax.set_yticks(range(7))
+            ax.set_yticklabels(WEEKDAYS)
+            ax.set_xticks(range(0, 24, 2))
+            ax.set_xticklabels([f"{hour:02}:00" for hour in range(0, 24, 2)])
+            ax.tick_params(colors=text_color)
+            ax.set_xlabel('Hour of Day', fontsize=12, color=text_color)
+            ax.set_title('When Time Is Spent', fontsize=14, fontweight='bold', color=text_color)
+            colorbar = self.figure.colorbar(self.image, ax=ax)
+            colorbar.set_label('Hours Worked', color=text_color)
+            colorbar.ax.tick_params(colors=text_color)
+            self.figure.patch.set_facecolor(self.chart.background_color)
+            self.figure.tight_layout()
+        else:
+            self.image.set_data(hours)
+        self.image.set_clim(0, max(hours.max(), 1e-9))
+        self.canvas.draw_idle()
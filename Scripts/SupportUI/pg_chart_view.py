@@ -0,0 +1,208 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+import pyqtgraph as pg
+import numpy as np
+
+from Scripts.Analytics.heatmap import WEEKDAYS
+from Scripts.SupportUI.chart_views import BarHitIndex, BAR_WIDTH
+
+# Most period labels shown under the bars, longer ranges label every n-th bar
+MAX_PERIOD_LABELS = 30
+
+
+def _StyleAxes(plot_item, text_color):
+    for name in ("left", "bottom"):
+        axis = plot_item.getAxis(name)
+        axis.setPen(pg.mkPen(text_color))
+        axis.setTextPen(pg.mkPen(text_color))
+
+
+class BarView(QWidget):
+    """Stacked bars drawn natively by Qt through pyqtgraph"""
+
+    def __init__(self, chart, parent=None):
+        super().__init__(parent)
+        self.chart = chart  # Supplies colors and formatting
+
+        self.plot_widget = pg.PlotWidget(background=chart.background_color)
+        self.plot_item = self.plot_widget.getPlotItem()
+        self.plot_item.setMenuEnabled(False)
+        self.plot_item.hideButtons()
+        self.plot_item.setMouseEnabled(x=False, y=False)
+        self.plot_item.showGrid(y=True, alpha=0.2)
+        _StyleAxes(self.plot_item, chart.text_color)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.plot_widget)
+
+        self.bar_items = []
+        self.bar_periods = []
+        self.hit_index = BarHitIndex()
+        self.legend = None
+        self.message = None
+        self.live_item = None
+
+        self.tooltip = pg.TextItem(
+            color=chart.text_color,
+            anchor=(0, 1),
+            fill=pg.mkBrush(chart.lighten_color(chart.background_color, 40)),
+            border=pg.mkPen(chart.lighten_color(chart.background_color, 60))
+        )
+        self.tooltip.setZValue(100)
+        self.tooltip_segment = None
+        self.plot_widget.scene().sigMouseMoved.connect(self.on_hover)
+
+    def build(self, categories, hours, periods, aggregation_type):
+        """Rebuild the bars, axes and legend from scratch"""
+        background_color = self.chart.background_color
+        text_color = self.chart.text_color
+
+        for item in self.bar_items:
+            self.plot_item.removeItem(item)
+        self.bar_items = []
+        if self.legend is not None:
+            self.legend.scene().removeItem(self.legend)
+            self.legend = None
+        if self.message is not None:
+            self.plot_item.removeItem(self.message)
+            self.message = None
+        if self.live_item is not None:
+            self.plot_item.removeItem(self.live_item)
+            self.live_item = None
+        self.plot_item.removeItem(self.tooltip)
+        self.tooltip_segment = None
+        self.hit_index.clear()
+
+        self.plot_item.setTitle('Task Time Distribution', color=text_color, size='14pt', bold=True)
+        self.plot_item.setLabel('left', 'Hours Worked', color=text_color)
+        self.plot_item.setLabel('bottom', f'Time Period ({aggregation_type})', color=text_color)
+
+        if not periods:
+            self.message = pg.TextItem('No data available', color=text_color, anchor=(0.5, 0.5))
+            self.plot_item.addItem(self.message)
+            self.plot_item.setRange(xRange=(0, 1), yRange=(0, 1))
+            self.message.setPos(0.5, 0.5)
+            return
+
+        self.bar_periods = periods
+        positions = np.arange(len(periods))
+        self.legend = self.plot_item.addLegend(
+            offset=(-10, 10),
+            labelTextColor=text_color,
+            brush=pg.mkBrush(self.chart.lighten_color(background_color, 20)),
+            pen=pg.mkPen(self.chart.lighten_color(background_color, 40))
+        )
+
+        edge_pen = pg.mkPen(self.chart.lighten_color(background_color, 30), width=0.5)
+        bottom = np.zeros(len(periods))
+        for (category_id, category, color), values in zip(categories, hours):
+            brush = pg.mkColor(color)
+            brush.setAlphaF(0.8)
+            item = pg.BarGraphItem(x=positions, height=values, y0=bottom.copy(), width=BAR_WIDTH,
+                                   brush=brush, pen=edge_pen, name=category)
+            # Named items are listed in the legend as they are added
+            self.plot_item.addItem(item)
+            self.bar_items.append((category, item))
+            bottom += values
+        self.hit_index.build(hours)
+
+        step = max(1, -(-len(periods) // MAX_PERIOD_LABELS))
+        self.plot_item.getAxis('bottom').setTicks([[(i, periods[i]) for i in range(0, len(periods), step)]])
+        self.plot_item.addItem(self.tooltip, ignoreBounds=True)
+        self.tooltip.hide()
+        self.plot_item.setXRange(-0.5, len(periods) - 0.5, padding=0.01)
+        self.plot_item.enableAutoRange(axis='y')
+
+    def update_bars(self, hours):
+        """Move the existing bars to new values"""
+        if not self.bar_items:
+            return
+        bottom = np.zeros(hours.shape[1])
+        for (category, item), values in zip(self.bar_items, hours):
+            item.setOpts(height=values, y0=bottom.copy())
+            bottom += values
+        self.hit_index.build(hours)
+        self.tooltip_segment = None
+
+    def update_period(self, hours, period):
+        """Resize one period's segments; a BarGraphItem only takes whole arrays, so all bars are set"""
+        self.update_bars(hours)
+
+    def set_live(self, period, segments):
+        """Stack the running sessions on a period's bar, segments are [(bottom, hours, color)]
+
+        They are a separate item, so only its few rectangles repaint as they grow.
+        """
+        if not self.bar_items:
+            return
+        if self.live_item is None:
+            self.live_item = pg.BarGraphItem(x=[], height=[], width=BAR_WIDTH,
+                                             pen=pg.mkPen(self.chart.lighten_color(self.chart.background_color, 30), width=0.5))
+            self.plot_item.addItem(self.live_item)
+        brushes = []
+        for _, _, color in segments:
+            brush = pg.mkColor(color)
+            brush.setAlphaF(0.8)
+            brushes.append(pg.mkBrush(brush))
+        self.live_item.setOpts(
+            x=np.full(len(segments), period),
+            y0=np.array([bottom for bottom, _, _ in segments], float),
+            height=np.array([hours for _, hours, _ in segments], float),
+            brushes=brushes
+        )
+
+    def on_hover(self, scene_pos):
+        """Handle mouse hover events for tooltips"""
+        view_box = self.plot_item.getViewBox()
+        segment = None
+        if view_box.sceneBoundingRect().contains(scene_pos):
+            point = view_box.mapSceneToView(scene_pos)
+            segment = self.hit_index.hit(point.x(), point.y())
+        if segment is None:
+            self.tooltip.hide()
+            self.tooltip_segment = None
+            return
+        if segment != self.tooltip_segment:
+            category, period = segment
+            hours_text = self.chart.format_hours(self.hit_index.value(segment))
+            self.tooltip.setText(f"{self.bar_items[category][0]}\n{hours_text}\n{self.bar_periods[period]}")
+            self.tooltip_segment = segment
+        self.tooltip.setPos(point.x(), point.y())
+        self.tooltip.show()
+
+
+class HeatmapView(QWidget):
+    """Weekday by hour of day image drawn through pyqtgraph"""
+
+    def __init__(self, chart, parent=None):
+        super().__init__(parent)
+        self.chart = chart
+        text_color = chart.text_color
+
+        self.plot_widget = pg.PlotWidget(background=chart.background_color)
+        plot_item = self.plot_widget.getPlotItem()
+        plot_item.setMenuEnabled(False)
+        plot_item.hideButtons()
+        plot_item.setMouseEnabled(x=False, y=False)
+        plot_item.invertY(True)
+        plot_item.setTitle('When Time Is Spent', color=text_color, size='14pt', bold=True)
+        plot_item.setLabel('bottom', 'Hour of Day', color=text_color)
+        _StyleAxes(plot_item, text_color)
+        plot_item.getAxis('left').setTicks([[(day + 0.5, name) for day, name in enumerate(WEEKDAYS)]])
+        plot_item.getAxis('bottom').setTicks([[(hour + 0.5, f"{hour:02}:00") for hour in range(0, 24, 2)]])
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.plot_widget)
+
+        # Image columns are x, so the grid is transposed to put hours across
+        self.image = pg.ImageItem(np.zeros((24, 7)))
+        plot_item.addItem(self.image)
+        self.colorbar = pg.ColorBarItem(values=(0, 1), colorMap=pg.colormap.get('magma'),
+                                        label='Hours Worked', interactive=False)
+        self.colorbar.setImageItem(self.image, insert_in=plot_item)
+        plot_item.setRange(xRange=(0, 24), yRange=(0, 7), padding=0)
+
+    def draw(self, hours):
+        """Show a 7x24 grid of hours"""
+        top = max(hours.max(), 1e-9)
+        self.image.setImage(hours.T, autoLevels=False)
+        self.colorbar.setLevels((0, top))
@@ -0,0 +1,111 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
+                            QLabel, QSpinBox, QTreeWidget, QTreeWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt
+
+from Scripts.Analytics.ranking import TopTasks, TopCategories
+from Scripts.Analytics.work_log import DayNumber
+from Scripts.Tasks.clock import GetClock, MonotonicMs
+from Scripts.Tasks.qt_adapters import GetQtClock
+
+DEFAULT_TOP_N = 10
+# While a task is focused the ranking is refreshed at most this often
+LIVE_REFRESH_INTERVAL_MS = 1000
+
+
+class TaskRankingPanel(QWidget):
+    """The tasks or categories with the most time over the chart's selected range"""
+
+    def __init__(self, task_manager, chart, parent=None, background_color="#2b2b2b", text_color="#ffffff"):
+        super().__init__(parent)
+        self.task_manager = task_manager
+        self.chart = chart  # Supplies the date range, names and formatting
+        self.background_color = background_color
+        self.text_color = text_color
+        self.last_live_refresh = 0
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        controls_layout = QHBoxLayout()
+        controls_layout.addWidget(QLabel("Top"))
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(1, 100)
+        self.count_spin.setValue(DEFAULT_TOP_N)
+        self.count_spin.valueChanged.connect(self.refresh)
+        controls_layout.addWidget(self.count_spin)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(["Tasks", "Categories"])
+        self.mode_combo.currentTextChanged.connect(self.refresh)
+        controls_layout.addWidget(self.mode_combo)
+        controls_layout.addStretch()
+        layout.addLayout(controls_layout)
+
+        self.ranking_tree = QTreeWidget()
+        self.ranking_tree.setHeaderLabels(["#", "Name", "Time"])
+        self.ranking_tree.setRootIsDecorated(False)
+        self.ranking_tree.setSelectionMode(QTreeWidget.SelectionMode.NoSelection)
+        header = self.ranking_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.ranking_tree)
+
+        self.set_theme(background_color, text_color)
+        GetQtClock().tick.connect(self.on_tick)
+        self.refresh()
+
+    def on_tick(self):
+        """Keep the running task's time current without re-ranking on every tick"""
+        now = MonotonicMs()
+        if self.isVisible() and now - self.last_live_refresh >= LIVE_REFRESH_INTERVAL_MS:
+            self.refresh()
+
+    def get_name(self, key):
+        if self.mode_combo.currentText() == "Categories":
+            return self.chart.get_category_name(key)
+        task = self.task_manager.GetTask(key)
+        return task.name if task else "Deleted task"
+
+    def refresh(self):
+        """Re-rank over the chart's current date range"""
+        self.last_live_refresh = MonotonicMs()
+        start_date, end_date = self.chart.get_date_range()
+        top = TopCategories if self.mode_combo.currentText() == "Categories" else TopTasks
+        ranking = top(DayNumber(start_date), DayNumber(end_date), self.count_spin.value(),
+                      GetClock().activeTasks)
+
+        self.ranking_tree.clear()
+        for place, (key, ms) in enumerate(ranking, 1):
+            item = QTreeWidgetItem([str(place), self.get_name(key),
+                                    self.chart.format_hours(ms / (1000 * 3600))])
+            item.setTextAlignment(2, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            self.ranking_tree.addTopLevelItem(item)
+
+    def set_theme(self, background_color, text_color):
+        """Update the theme colors"""
+        self.background_color = background_color
+        self.text_color = text_color
+        border_color = self.chart.lighten_color(background_color, 40)
+        self.setStyleSheet(f"""
+            QWidget {{
+                background-color: {background_color};
+                color: {text_color};
+            }}
+            QTreeWidget {{
+                border: 1px solid {border_color};
+                border-radius: 3px;
+            }}
+            QHeaderView::section {{
+                background-color: {self.chart.lighten_color(background_color, 20)};
+                color: {text_color};
+                border: none;
+                padding: 4px;
+            }}
+            QComboBox, QSpinBox {{
+                background-color: {self.chart.lighten_color(background_color, 20)};
+                border: 1px solid {border_color};
+                padding: 3px;
+                border-radius: 3px;
+            }}
+        """)
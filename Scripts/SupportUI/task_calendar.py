@@ -1,39 +1,82 @@
 import sys
 from datetime import datetime, timedelta
-from collections import defaultdict
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, 
-                            QLabel, QDateEdit, QCheckBox, QPushButton)
-from PyQt6.QtCore import Qt, QDate
+                            QLabel, QDateEdit, QCheckBox, QPushButton, QTabWidget)
+from PyQt6.QtCore import Qt, QDate, QTimer, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
+
+from Scripts.Analytics.work_log import DayNumber, DayFromNumber, BucketStarts, BucketCount, ParseDays, GRANULARITIES
+from Scripts.Analytics.rollup import GetRollup
+from Scripts.Analytics.range_index import GetCategoryIndex
+from Scripts.Analytics.comparison import COMPARISONS, ComparePeriods
+from Scripts.Analytics.heatmap import GetHeatmap
+from Scripts.SupportUI.aggregation_worker import AggregationWorker
+from Scripts.SupportUI.chart_views import AvailableBackends, CreateChartViews, DEFAULT_CHART_BACKEND
+from Scripts.SupportUI.task_events import GetTaskEvents
+from Scripts.Tasks.clock import GetClock, MonotonicMs
+from Scripts.Tasks.qt_adapters import GetQtClock
+
+# Control changes within this window are folded into one aggregation
+AGGREGATION_DEBOUNCE_MS = 150
+# While a task is focused its live segment is resized at most this often
+LIVE_BAR_INTERVAL_MS = 1000
+# With automatic detail, grouping gets coarser until every bar is at least this wide
+MIN_BAR_WIDTH_PX = 12
+# Structural changes that alter the bars, their legend or their colors; renames
+# and new tasks carry no logged time and leave the chart alone
+CHART_EVENTS = {"CategoryAdded", "CategoryEdited", "CategoryDeleted", "TaskMoved", "TaskDeleted", "Loaded"}
 
 class TaskAnalyticsChart(QWidget):
+    # Emitted whenever the data or the selected range is redrawn
+    chart_updated = pyqtSignal()
+
     def __init__(self, task_manager, parent=None, background_color="#2b2b2b", text_color="#ffffff"):
         super().__init__(parent)
         self.task_manager = task_manager  # Reference to your task_manager module
+        self.rollup = GetRollup()
         self.background_color = background_color
         self.text_color = text_color
         
         # Set widget background
         self.setStyleSheet(f"background-color: {background_color}; color: {text_color};")
         
+        # Aggregation runs on the thread pool; each change bumps the request id so
+        # results of superseded requests are dropped
+        self.request_id = 0
+        # Periods and categories the current bars were built for, None forces a rebuild
+        self.bar_layout = None
+        self.bar_hours = None
+        self.aggregation_pending = False
+        # Grouping actually drawn, coarser than the selected one when automatic detail kicks in
+        self.effective_aggregation = None
+        
+        # Running sessions' uncommitted time, drawn as live segments on the current
+        # period's bar; committed time goes into that bar's own segments
+        self.live_drawn = None
+        self.last_live_update = 0
+        self.aggregation_worker = None
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(AGGREGATION_DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.start_aggregation)
+        
         # Create the main layout
         layout = QVBoxLayout(self)
         
         # Create controls
         self.create_controls(layout)
         
-        # Create matplotlib figure and canvas
+        # Create the chart tabs and the selected renderer's views
         self.create_chart(layout)
         
-        # Store data for tooltips
-        self.tooltip_data = {}
         
         # Initial chart update
         self.update_chart()
+        
+        # Keep the current period's bar growing while a task is focused
+        self.task_manager.Subscribe(self.on_task_event)
+        GetQtClock().tick.connect(self.on_tick)
+        GetTaskEvents().changed.connect(self.on_tasks_changed)
     
     def create_controls(self, main_layout):
         """Create the control panel with date range and aggregation options"""
@@ -141,24 +184,151 @@ class TaskAnalyticsChart(QWidget):
         self.aggregation_combo.currentTextChanged.connect(self.update_chart)
         date_layout.addWidget(self.aggregation_combo)
         
+        # Long ranges are grouped more coarsely unless the user turns this off
+        self.auto_detail_checkbox = QCheckBox("Auto detail")
+        self.auto_detail_checkbox.setChecked(True)
+        self.auto_detail_checkbox.setToolTip("Group by weeks, months or years when there are too many bars to fit")
+        self.auto_detail_checkbox.stateChanged.connect(self.update_chart)
+        date_layout.addWidget(self.auto_detail_checkbox)
+        self.detail_label = QLabel()
+        date_layout.addWidget(self.detail_label)
+        
         layout.addLayout(date_layout)
-        main_layout.addWidget(controls_widget)
-    
-    def create_chart(self, main_layout):
-        """Create the matplotlib chart"""
-        # Set matplotlib style to match dark theme
-        plt.style.use('dark_background' if self.is_dark_theme() else 'default')
         
-        self.figure = Figure(figsize=(12, 6), facecolor=self.background_color)
-        self.canvas = FigureCanvas(self.figure)
+        # Third row: Range total and period-over-period comparison
+        summary_layout = QHBoxLayout()
         
-        # Connect mouse motion event for tooltips
-        self.canvas.mpl_connect('motion_notify_event', self.on_hover)
+        self.total_label = QLabel()
+        summary_layout.addWidget(self.total_label)
         
-        # Create tooltip
-        self.tooltip = None
+        summary_layout.addStretch()
         
-        main_layout.addWidget(self.canvas)
+        summary_layout.addWidget(QLabel("Compare:"))
+        self.comparison_combo = QComboBox()
+        self.comparison_combo.addItems(["None", *COMPARISONS])
+        self.comparison_combo.currentTextChanged.connect(self.update_comparison)
+        summary_layout.addWidget(self.comparison_combo)
+        
+        # Renderers are listed only if their plotting library is installed
+        summary_layout.addWidget(QLabel("Renderer:"))
+        self.renderer_combo = QComboBox()
+        backends = AvailableBackends()
+        self.renderer_combo.addItems(backends)
+        if DEFAULT_CHART_BACKEND in backends:
+            self.renderer_combo.setCurrentText(DEFAULT_CHART_BACKEND)
+        self.renderer_combo.currentTextChanged.connect(self.change_renderer)
+        summary_layout.addWidget(self.renderer_combo)
+        
+        layout.addLayout(summary_layout)
+        
+        self.comparison_label = QLabel()
+        self.comparison_label.setVisible(False)
+        layout.addWidget(self.comparison_label)
+        
+        main_layout.addWidget(controls_widget)
+    
+    def create_chart(self, main_layout):
+        """Create the chart tabs"""
+        self.bar_view = None
+        self.heatmap_view = None
+        
+        # Bar chart and heatmap share the space as tabs
+        self.tabs = QTabWidget()
+        self.tabs.setStyleSheet(self.tab_style())
+        self.tabs.addTab(QWidget(), "Distribution")
+        self.tabs.addTab(self.create_heatmap(), "Heatmap")
+        self.create_views()
+        self.tabs.currentChanged.connect(self.update_heatmap)
+        
+        main_layout.addWidget(self.tabs)
+    
+    def create_views(self):
+        """Put the selected renderer's bar and heatmap views in place of the current ones"""
+        self.bar_view, heatmap_view = CreateChartViews(self.renderer_combo.currentText(), self)
+        
+        current = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        old_bar_view = self.tabs.widget(0)
+        self.tabs.removeTab(0)
+        old_bar_view.deleteLater()
+        self.tabs.insertTab(0, self.bar_view, "Distribution")
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        
+        if self.heatmap_view is not None:
+            self.heatmap_layout.removeWidget(self.heatmap_view)
+            self.heatmap_view.deleteLater()
+        self.heatmap_view = heatmap_view
+        self.heatmap_layout.addWidget(self.heatmap_view)
+        
+        # Both new views start empty
+        self.bar_layout = None
+        self.heatmap_drawn_key = None
+    
+    def change_renderer(self):
+        """Switch the chart to another renderer"""
+        self.create_views()
+        self.update_chart()
+    
+    def tab_style(self):
+        """Stylesheet for the chart tabs"""
+        return f"""
+            QTabWidget::pane {{
+                border: 1px solid {self.lighten_color(self.background_color, 40)};
+            }}
+            QTabBar::tab {{
+                background-color: {self.lighten_color(self.background_color, 20)};
+                color: {self.text_color};
+                padding: 5px 15px;
+            }}
+            QTabBar::tab:selected {{
+                background-color: {self.lighten_color(self.background_color, 40)};
+            }}
+        """
+    
+    def create_heatmap(self):
+        """Create the hour of day by weekday heatmap tab"""
+        self.heatmap = GetHeatmap()
+        heatmap_widget = QWidget()
+        layout = QVBoxLayout(heatmap_widget)
+        self.heatmap_layout = layout
+        
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Category:"))
+        self.heatmap_category_combo = QComboBox()
+        self.heatmap_category_combo.currentIndexChanged.connect(self.update_heatmap)
+        filter_layout.addWidget(self.heatmap_category_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+        
+        # The renderer's heatmap view is added below the filter by create_views
+        self.heatmap_drawn_key = None
+        return heatmap_widget
+    
+    def refresh_heatmap_categories(self):
+        """Sync the heatmap filter with the current categories, keeping the selection"""
+        selected = self.heatmap_category_combo.currentData()
+        self.heatmap_category_combo.blockSignals(True)
+        self.heatmap_category_combo.clear()
+        self.heatmap_category_combo.addItem("All Categories", None)
+        for category_id, category in self.task_manager.CATEGORIES.items():
+            self.heatmap_category_combo.addItem(category["Name"], category_id)
+        index = self.heatmap_category_combo.findData(selected)
+        self.heatmap_category_combo.setCurrentIndex(max(index, 0))
+        self.heatmap_category_combo.blockSignals(False)
+    
+    def update_heatmap(self):
+        """Redraw the heatmap if it is visible and its data changed"""
+        if self.tabs.currentIndex() != 1:
+            return
+        category_id = self.heatmap_category_combo.currentData()
+        key = (self.heatmap.version, category_id)
+        if key == self.heatmap_drawn_key:
+            return
+        self.heatmap_drawn_key = key
+        
+        hours = self.heatmap.grid(None if category_id is None else {category_id}) / (1000 * 3600)
+        self.heatmap_view.draw(hours)
     
     def is_dark_theme(self):
         """Determine if we're using a dark theme based on background color"""
@@ -211,218 +381,221 @@ class TaskAnalyticsChart(QWidget):
         
         return start, end
     
-    def get_aggregated_data(self, aggregation_type):
-        """Aggregate task data by the specified time period and date range"""
-        all_tasks = self.task_manager.GetTasks()
-        start_date, end_date = self.get_date_range()
-        
-        # Collect all daily work data within the date range
-        aggregated_data = defaultdict(lambda: defaultdict(float))
-        
-        for task in all_tasks:
-            category = self.task_manager.GetCategory(task.categoryId)
-            category_name = category["Name"]
-            
-            for date_str, hours in task.dailyWork.items():
-                # Convert milliseconds to hours
-                hours_worked = hours / (1000 * 3600)
-                
-                # Parse the date
-                try:
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    continue
-                
-                # Filter by date range
-                if date_obj < start_date or date_obj > end_date:
-                    continue
-                
-                # Determine the aggregation key
-                date_obj_dt = datetime.combine(date_obj, datetime.min.time())
-                if aggregation_type == "Day":
-                    key = date_obj.strftime("%m/%d")
-                elif aggregation_type == "Week":
-                    # Get Monday of the week
-                    monday = date_obj - timedelta(days=date_obj.weekday())
-                    key = f"{monday.strftime('%m/%d')}"
-                elif aggregation_type == "Month":
-                    key = date_obj.strftime("%Y-%m")
-                elif aggregation_type == "Year":
-                    key = date_obj.strftime("%Y")
-                
-                aggregated_data[key][category_name] += hours_worked
-        
-        return dict(aggregated_data)
-    
-    def get_color_for_category(self, category_name):
+    def format_period(self, bucket_start, aggregation_type):
+        """Label for the period starting on the given day number"""
+        period_date = DayFromNumber(bucket_start)
+        if aggregation_type == "Month":
+            return period_date.strftime("%Y-%m")
+        if aggregation_type == "Year":
+            return period_date.strftime("%Y")
+        return period_date.strftime("%m/%d")
+    
+    def get_category_name(self, category_id):
+        """Get a category's name from the task manager"""
+        category = self.task_manager.CATEGORIES.get(int(category_id))
+        return category["Name"] if category else "Unknown"
+    
+    def get_color_for_category(self, category_id):
         """Get color for a category from the task manager"""
-        for category in self.task_manager.CATEGORIES.values():
-            if category["Name"] == category_name:
-                # Convert the Color object to a hex string if needed
-                color = category["Color"]
-                if hasattr(color, '__str__'):
-                    return str(color)
-                return color
+        category = self.task_manager.CATEGORIES.get(int(category_id))
+        if category:
+            # Convert the Color object to a hex string
+            return str(category["Color"])
         return '#3498db'  # Default blue color
     
-    def update_chart(self):
-        """Update the chart with current data and settings"""
-        aggregation_type = self.aggregation_combo.currentText()
-        data = self.get_aggregated_data(aggregation_type)
-        
-        # Clear the previous plot and reset bar segments
-        self.figure.clear()
-        self.bar_segments = []
-        if self.tooltip:
-            self.tooltip = None
-        
-        ax = self.figure.add_subplot(111, facecolor=self.background_color)
-        
-        if not data:
-            ax.text(0.5, 0.5, 'No data available', ha='center', va='center', 
-                   transform=ax.transAxes, fontsize=14, color=self.text_color)
-            self.figure.patch.set_facecolor(self.background_color)
-            self.canvas.draw()
+    def format_hours(self, hours):
+        """Format an amount of hours for display"""
+        if hours >= 1:
+            return f"{hours:.1f} hours"
+        elif hours >= 0.1:
+            return f"{hours:.2f} hours"
+        minutes = hours * 60
+        return f"{minutes:.0f} minutes"
+    
+    def update_total(self):
+        """Show the total time in the selected range, two index lookups per category"""
+        start_date, end_date = self.get_date_range()
+        index = GetCategoryIndex()
+        total_ms = index.totals(index.allKeys(), DayNumber(start_date), DayNumber(end_date)).sum()
+        self.total_label.setText(f"Total: {self.format_hours(total_ms / (1000 * 3600))}")
+    
+    def update_comparison(self):
+        """Show the selected period-over-period comparison per category"""
+        comparison = self.comparison_combo.currentText()
+        if comparison == "None":
+            self.comparison_label.setVisible(False)
             return
         
-        # Get all unique categories and time periods
-        all_categories = set()
-        for period_data in data.values():
-            all_categories.update(period_data.keys())
-        all_categories = sorted(list(all_categories))
-        
-        # Sort time periods
-        periods = sorted(data.keys())
-        
-        # Prepare data for stacked bar chart
-        category_data = {}
-        for category in all_categories:
-            category_data[category] = [data[period].get(category, 0) for period in periods]
-        
-        # Create the stacked bar chart
-        bottom = np.zeros(len(periods))
-        self.bar_segments = []  # Store bar segments for tooltip detection
-        
-        for category_idx, category in enumerate(all_categories):
-            color = self.get_color_for_category(category)
-            values = category_data[category]
-            
-            bars = ax.bar(periods, values, bottom=bottom, label=category, 
-                         color=color, alpha=0.8, edgecolor=self.lighten_color(self.background_color, 30), 
-                         linewidth=0.5)
-            
-            # Store bar segment info for tooltips
-            for bar_idx, (bar, value) in enumerate(zip(bars, values)):
-                if value > 0:  # Only store segments with actual data
-                    self.bar_segments.append({
-                        'bar': bar,
-                        'category': category,
-                        'period': periods[bar_idx],
-                        'hours': value,
-                        'bottom': bottom[bar_idx],
-                        'top': bottom[bar_idx] + value
-                    })
-            
-            bottom += values
-        
-        # Customize the chart appearance
-        ax.set_facecolor(self.background_color)
-        ax.tick_params(colors=self.text_color)
-        ax.set_ylabel('Hours Worked', fontsize=12, color=self.text_color)
-        ax.set_xlabel(f'Time Period ({aggregation_type})', fontsize=12, color=self.text_color)
-        ax.set_title('Task Time Distribution', fontsize=14, fontweight='bold', color=self.text_color)
-        
-        # Rotate x-axis labels for better readability
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right', color=self.text_color)
-        
-        # Add legend
-        if all_categories:
-            legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
-            legend.get_frame().set_facecolor(self.lighten_color(self.background_color, 20))
-            legend.get_frame().set_edgecolor(self.lighten_color(self.background_color, 40))
-            for text in legend.get_texts():
-                text.set_color(self.text_color)
-        
-        # Add grid for better readability
-        ax.grid(True, alpha=0.2, axis='y', color=self.text_color)
-        ax.set_axisbelow(True)
-        
-        # Set figure background
-        self.figure.patch.set_facecolor(self.background_color)
-        
-        # Adjust layout to prevent label cutoff
-        self.figure.tight_layout()
-        
-        # Refresh the canvas
-        self.canvas.draw()
-    
-    def on_hover(self, event):
-        """Handle mouse hover events for tooltips"""
-        if event.inaxes is None or not hasattr(self, 'bar_segments'):
-            self.hide_tooltip()
-            return
+        results = ComparePeriods(GetCategoryIndex(), comparison, datetime.now().date())
+        lines = []
+        for category_id, (current, previous) in sorted(results.items(), key=lambda item: -item[1][0]):
+            current_hours = current / (1000 * 3600)
+            previous_hours = previous / (1000 * 3600)
+            change = f"{(current - previous) / previous:+.0%}" if previous else "new"
+            lines.append(
+                f"{self.get_category_name(category_id)}: {self.format_hours(current_hours)} "
+                f"vs {self.format_hours(previous_hours)} ({change})"
+            )
+        self.comparison_label.setText("\n".join(lines) if lines else "No data for either period")
+        self.comparison_label.setVisible(True)
+    
+    def update_chart(self):
+        """Update the chart with current data and settings once the controls settle"""
+        self.request_id += 1
+        self.aggregation_pending = True
+        self.debounce_timer.start()
+    
+    def start_aggregation(self):
+        """Refresh the cheap summaries and aggregate the bars off the GUI thread"""
+        self.update_total()
+        self.update_comparison()
+        self.refresh_heatmap_categories()
+        self.update_heatmap()
+        self.chart_updated.emit()
         
-        # Check if mouse is over any bar segment
-        for segment in self.bar_segments:
-            bar = segment['bar']
-            
-            # Get bar boundaries
-            bar_x = bar.get_x()
-            bar_width = bar.get_width()
-            bar_left = bar_x
-            bar_right = bar_x + bar_width
-            
-            # Check if mouse is within this bar's x range
-            if bar_left <= event.xdata <= bar_right:
-                # Check if mouse is within this segment's y range
-                if segment['bottom'] <= event.ydata <= segment['top']:
-                    self.show_tooltip(event, segment)
-                    return
-        
-        self.hide_tooltip()
-    
-    def show_tooltip(self, event, segment):
-        """Show tooltip with category and hours information"""
-        # Remove existing tooltip
-        if self.tooltip:
-            self.tooltip.remove()
-        
-        # Format hours nicely
-        hours = segment['hours']
-        if hours >= 1:
-            hours_text = f"{hours:.1f} hours"
-        elif hours >= 0.1:
-            hours_text = f"{hours:.2f} hours"
+        start_date, end_date = self.get_date_range()
+        self.effective_aggregation = self.choose_aggregation()
+        if self.effective_aggregation != self.aggregation_combo.currentText():
+            self.detail_label.setText(f"(showing {self.effective_aggregation})")
         else:
-            minutes = hours * 60
-            hours_text = f"{minutes:.0f} minutes"
-        
-        # Create tooltip text
-        tooltip_text = f"{segment['category']}\n{hours_text}\n{segment['period']}"
-        
-        # Create tooltip annotation
-        ax = event.inaxes
-        self.tooltip = ax.annotate(
-            tooltip_text,
-            xy=(event.xdata, event.ydata),
-            xytext=(20, 20), textcoords='offset points',
-            bbox=dict(boxstyle='round,pad=0.5', 
-                     facecolor=self.lighten_color(self.background_color, 40),
-                     edgecolor=self.lighten_color(self.background_color, 60),
-                     alpha=0.9),
-            fontsize=10,
-            color=self.text_color,
-            ha='left'
+            self.detail_label.setText("")
+        self.aggregation_worker = AggregationWorker(
+            self.rollup, self.request_id, lambda: self.request_id,
+            DayNumber(start_date), DayNumber(end_date), self.effective_aggregation
         )
+        self.aggregation_worker.signals.finished.connect(self.on_aggregation_finished)
+        QThreadPool.globalInstance().start(self.aggregation_worker)
+    
+    def choose_aggregation(self):
+        """The selected grouping, or the finest coarser one whose bars fit the chart's width"""
+        selected = self.aggregation_combo.currentText()
+        if not self.auto_detail_checkbox.isChecked():
+            return selected
+        start_date, end_date = self.get_date_range()
+        max_bars = max(1, self.tabs.width() // MIN_BAR_WIDTH_PX)
+        for aggregation_type in GRANULARITIES[GRANULARITIES.index(selected):]:
+            if BucketCount(DayNumber(start_date), DayNumber(end_date), aggregation_type) <= max_bars:
+                return aggregation_type
+        return GRANULARITIES[-1]
+    
+    def resizeEvent(self, a0):
+        """Regroup when a resize changes how many bars fit"""
+        super().resizeEvent(a0)
+        if self.effective_aggregation is not None and self.choose_aggregation() != self.effective_aggregation:
+            self.update_chart()
+    
+    def on_aggregation_finished(self, request_id, result):
+        """Draw an aggregation unless the controls changed while it ran"""
+        if request_id != self.request_id:
+            return
+        self.aggregation_pending = False
+        bucket_starts, category_ids, totals_ms = result
+        self.draw_chart(bucket_starts, category_ids, totals_ms / (1000 * 3600))
+        self.live_drawn = None
+        self.update_live()
+    
+    def draw_chart(self, bucket_starts, category_ids, hours):
+        """Draw the stacked bars, hours is a [category, period] matrix
+        
+        The view is only rebuilt when the periods or categories change, otherwise
+        its existing bars are resized in place.
+        """
+        aggregation_type = self.effective_aggregation
+        
+        # Order categories by name for a stable legend
+        order = sorted(range(len(category_ids)), key=lambda i: self.get_category_name(category_ids[i]))
+        categories = tuple(
+            (int(category_ids[i]), self.get_category_name(category_ids[i]), self.get_color_for_category(category_ids[i]))
+            for i in order
+        )
+        layout = (aggregation_type, tuple(bucket_starts.tolist()), categories)
+        hours = hours[order]
+        self.bar_hours = hours
         
-        self.canvas.draw_idle()
+        if layout == self.bar_layout:
+            self.bar_view.update_bars(hours)
+        else:
+            self.bar_layout = layout
+            periods = [self.format_period(start, aggregation_type) for start in bucket_starts]
+            self.bar_view.build(categories, hours, periods, aggregation_type)
     
-    def hide_tooltip(self):
-        """Hide the tooltip"""
-        if self.tooltip:
-            self.tooltip.remove()
-            self.tooltip = None
-            self.canvas.draw_idle()
+    def live_period(self):
+        """(period index, bucket start) of the bar today falls in, or None if it is not drawn"""
+        if self.bar_layout is None:
+            return None
+        start_date, end_date = self.get_date_range()
+        today = datetime.now().date()
+        if not start_date <= today <= end_date:
+            return None
+        aggregation_type, bucket_starts, _ = self.bar_layout
+        bucket_start = int(BucketStarts([DayNumber(today)], aggregation_type)[0])
+        if bucket_start not in bucket_starts:
+            return None
+        return bucket_starts.index(bucket_start), bucket_start
+    
+    def on_task_event(self, event, data):
+        """Grow the current period's segment of a category by its newly committed time"""
+        if event != "TaskWorked" or self.bar_layout is None:
+            return
+        if self.aggregation_pending:
+            # The running aggregation may or may not include this work, so redo it
+            self.update_chart()
+            return
+        live = self.live_period()
+        aggregation_type, _, categories = self.bar_layout
+        rows = {category[0]: row for row, category in enumerate(categories)}
+        start_date, end_date = self.get_date_range()
+        added_ms = 0
+        days, valid = ParseDays(data["Days"].keys())
+        for day, ms, parsed in zip(days.tolist(), data["Days"].values(), valid.tolist()):
+            if not parsed or not DayNumber(start_date) <= day <= DayNumber(end_date):
+                continue
+            bucket_start = int(BucketStarts([day], aggregation_type)[0])
+            if live is None or bucket_start != live[1] or data["Category"] not in rows:
+                # Time landed on a bar or in a category that is not drawn yet
+                self.update_chart()
+                return
+            added_ms += ms
+        if added_ms:
+            period, _ = live
+            self.bar_hours[rows[data["Category"]], period] += added_ms / (1000 * 3600)
+            self.bar_view.update_period(self.bar_hours, period)
+        self.update_live()
+    
+    def on_tasks_changed(self, events):
+        """Re-aggregate once for a batch of edits that can change the bars"""
+        if any(event in CHART_EVENTS for event, _ in events):
+            self.update_chart()
+    
+    def on_tick(self):
+        now = MonotonicMs()
+        if now - self.last_live_update >= LIVE_BAR_INTERVAL_MS:
+            self.update_live()
+    
+    def update_live(self):
+        """Resize the running sessions' uncommitted time on top of the current period's bar"""
+        self.last_live_update = MonotonicMs()
+        live = self.live_period()
+        if live is None or self.bar_hours is None or not self.bar_hours.size:
+            return
+        period, _ = live
+        live_ms = {}
+        for task in GetClock().activeTasks:
+            live_ms[task.categoryId] = live_ms.get(task.categoryId, 0) + task.pendingMs
+        
+        # Stack in legend order on top of the aggregated bar
+        segments = []
+        bottom = float(self.bar_hours[:, period].sum())
+        order = {category[0]: i for i, category in enumerate(self.bar_layout[2])}
+        for category_id in sorted(live_ms, key=lambda key: order.get(key, len(order))):
+            hours = live_ms[category_id] / (1000 * 3600)
+            if hours > 0:
+                segments.append((bottom, hours, self.get_color_for_category(category_id)))
+                bottom += hours
+        if segments == self.live_drawn:
+            return
+        self.live_drawn = segments
+        self.bar_view.set_live(period, segments)
     
     def refresh_data(self):
         """Call this method when task data is updated"""
@@ -434,8 +607,8 @@ class TaskAnalyticsChart(QWidget):
         self.text_color = text_color
         self.setStyleSheet(f"background-color: {background_color}; color: {text_color};")
         
-        # Update matplotlib style
-        plt.style.use('dark_background' if self.is_dark_theme() else 'default')
+        self.tabs.setStyleSheet(self.tab_style())
         
-        # Recreate the chart with new colors
-        self.update_chart()
\ No newline at end of file
+        # Recreate the views with the new colors
+        self.create_views()
+        self.update_chart()
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton
-from Scripts.Tasks.task_manager import CATEGORIES, CreateTask
+from Scripts.Tasks.task_manager import CATEGORIES, CreateTask, ChangeTaskCategory, EditTask
 from Scripts.SupportUI.category_dialog import CategoryCreationWindow
 
 class TaskCreationWindow(QDialog):
@@ -81,3 +81,72 @@ class TaskCreationWindow(QDialog):
 
         # Close dialog with success
         self.accept()
+
+
+class TaskEditDialog(QDialog):
+    def __init__(self, task, parent=None):
+        super().__init__(parent)
+        self.task = task
+        self.setWindowTitle("Edit Task")
+        self.setFixedSize(350, 300)
+        
+        layout = QVBoxLayout(self)
+        
+        # Task name
+        layout.addWidget(QLabel("Task Name:"))
+        self.name_input = QLineEdit(task.name)
+        layout.addWidget(self.name_input)
+        
+        # Category selection
+        layout.addWidget(QLabel("Category:"))
+        self.category_combo = QComboBox()
+        self.category_ids = []
+        current_index = 0
+        for i, (cat_id, cat_data) in enumerate(CATEGORIES.items()):
+            self.category_combo.addItem(cat_data["Name"])
+            self.category_ids.append(cat_id)
+            if cat_id == task.categoryId:
+                current_index = i
+        self.category_combo.setCurrentIndex(current_index)
+        layout.addWidget(self.category_combo)
+        
+        # Duration
+        layout.addWidget(QLabel("Duration (minutes):"))
+        duration_minutes = task.durationMs / (60 * 1000) if task.durationMs > 0 else 0
+        self.duration_input = QLineEdit(str(int(duration_minutes)) if duration_minutes > 0 else "")
+        self.duration_input.setPlaceholderText("Leave empty for unlimited")
+        layout.addWidget(self.duration_input)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        save_btn = QPushButton("Save")
+        save_btn.clicked.connect(self.save_changes)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(save_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+    
+    def save_changes(self):
+        # Update name
+        new_name = self.name_input.text().strip()
+        
+        # Update category if changed
+        new_category_id = self.category_ids[self.category_combo.currentIndex()]
+        if new_category_id != self.task.categoryId:
+            ChangeTaskCategory(self.task, new_category_id)
+        
+        # Update duration
+        duration_ms = None
+        duration_text = self.duration_input.text().strip()
+        if duration_text:
+            try:
+                duration_minutes = float(duration_text)
+                duration_ms = int(duration_minutes * 60 * 1000)
+            except ValueError:
+                pass
+        else:
+            duration_ms = 0
+        
+        EditTask(self.task, name=new_name or None, durationMs=duration_ms)
+        self.accept()
@@ -0,0 +1,51 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+import Scripts.Tasks.task_manager as task_manager
+
+# Events that change what the task views show, TaskWorked is kept for tasks that
+# finish while being worked on. Focus changes are left to the clock.
+VIEW_EVENTS = {
+    "CategoryAdded", "CategoryEdited", "CategoryDeleted",
+    "TaskCreated", "TaskEdited", "TaskMoved", "TaskDeleted", "TaskWorked",
+    "Loaded",
+}
+
+
+class TaskEventBatcher(QObject):
+    """Collects task_manager events and hands them on once per event loop turn.
+
+    Several edits in a row, like a dialog renaming a task and changing its
+    duration, reach the views as one batch of (event, data) pairs in order.
+    """
+    changed = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pending = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(0)
+        self.flush_timer.timeout.connect(self.flush)
+        task_manager.Subscribe(self.on_event)
+
+    def on_event(self, event, data):
+        if event not in VIEW_EVENTS:
+            return
+        self.pending.append((event, data))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        events, self.pending = self.pending, []
+        if events:
+            self.changed.emit(events)
+
+
+_TASK_EVENTS = None
+
+def GetTaskEvents():
+    """The shared batcher every task view listens to"""
+    global _TASK_EVENTS
+    if _TASK_EVENTS is None:
+        _TASK_EVENTS = TaskEventBatcher()
+    return _TASK_EVENTS
@@ -1,92 +1,224 @@
 from Scripts.Tasks.task import Task
+from Scripts.Tasks.clock import GetClock
+from Scripts.Tasks.qt_adapters import GetQtClock
+from Scripts.SupportUI.task_events import GetTaskEvents
+import Scripts.Tasks.task_manager as task_manager
 
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QProgressBar
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPen
+from PyQt6.QtWidgets import QSizePolicy, QWidget
 
 TASK_BAR_HEIGHT = 25
+TASK_BAR_SPACING = 6
+TASK_BAR_RADIUS = 4
 
-class TaskTimerBar(QProgressBar):
-    def __init__(self, task: Task, parent = None):
+BORDER_COLOR = "#555"
+# (background, chunk) colors of a focused and an idle bar
+ACTIVE_COLORS = ("#333", "#00aa00")
+INACTIVE_COLORS = ("#555", "#888")
+
+
+def FormatTimeLeft(task: Task):
+    msLeft = task.durationMs - task.elapsedTimeMs
+    seconds = msLeft // 1000
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    time = f"{seconds:02}"
+    if days > 0:
+        time = f"{days}:{hours:02}:{minutes:02}:{seconds:02}"
+    elif hours > 0:
+        time = f"{hours:02}:{minutes:02}:{seconds:02}"
+    elif minutes > 0:
+        time = f"{minutes:02}:{seconds:02}"
+
+    return time
+
+
+class TaskBarList(QWidget):
+    """Every task's remaining-time bar, painted by one widget.
+
+    Bars are not widgets of their own: the list hit-tests clicks and hovers
+    itself, and on each clock tick repaints only the rect of a focused bar whose
+    fill or text actually changed. It follows task_manager's events, adding and
+    removing only the bars of tasks that were created, deleted, shown or hidden.
+    """
+    # Emitted when bars were added or removed, so the window can resize
+    tasksChanged = pyqtSignal()
+
+    def __init__(self, parent = None):
         super().__init__(parent)
-        self.task = task
+        self.tasks = []
+        self.rows = {}  # Task id -> row
+        self.hoverRow = None
+        # What each row showed when last painted, row -> (fill width, text, active)
+        self.painted = {}
+
+        self.borderPen = QPen(QColor(BORDER_COLOR))
+        self.brushes = {
+            True: tuple(QBrush(QColor(color)) for color in ACTIVE_COLORS),
+            False: tuple(QBrush(QColor(color)) for color in INACTIVE_COLORS),
+        }
+
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+        GetQtClock().tick.connect(self.onTick)
+        task_manager.Subscribe(self.onTaskEvent)
+        GetTaskEvents().changed.connect(self.onTasksChanged)
+
+    def setTasks(self, tasks):
+        self.tasks = list(tasks)
+        self.rows = {task.id: row for row, task in enumerate(self.tasks)}
+        self.hoverRow = None
+        self.painted = {}
+        self.updateGeometry()
+        self.update()
+
+    def onTasksChanged(self, events):
+        """Apply a batch of task_manager events to the bars"""
+        removed = set()
+        added = set()
+        dirty = set()
+        # Set when bars must be laid out again: a shown task moved to another
+        # category, or a category went away with its tasks
+        reorder = False
+        for event, data in events:
+            if event == "Loaded":
+                self.setTasks(task for task in task_manager.GetTasks() if task.show)
+                removed.clear()
+                added.clear()
+                dirty.clear()
+                reorder = False
+                self.tasksChanged.emit()
+                continue
+            if event == "CategoryDeleted":
+                reorder = True
+                continue
+            if not event.startswith("Task"):
+                continue
+            taskId = data["Id"]
+            present = (taskId in self.rows and taskId not in removed) or taskId in added
+            if event == "TaskDeleted":
+                shown = False
+            elif event in ("TaskCreated", "TaskEdited"):
+                task = task_manager.GetTask(taskId)
+                shown = task is not None and task.show
+            else:
+                shown = present
+            if shown and not present:
+                if taskId in removed:
+                    removed.discard(taskId)
+                else:
+                    added.add(taskId)
+            elif present and not shown:
+                if taskId in added:
+                    added.discard(taskId)
+                else:
+                    removed.add(taskId)
+            elif present:
+                dirty.add(taskId)
+                reorder = reorder or event == "TaskMoved"
+
+        if removed or added or reorder:
+            # Bars follow GetTasks() order, as a rebuild would lay them out
+            kept = (self.rows.keys() - removed) | added
+            self.setTasks(task for task in task_manager.GetTasks() if task.id in kept)
+            self.tasksChanged.emit()
+        else:
+            for taskId in dirty:
+                self.updateRow(self.rows.get(taskId))
+
+    def sizeHint(self):
+        count = len(self.tasks)
+        return QSize(100, max(0, count * (TASK_BAR_HEIGHT + TASK_BAR_SPACING) - TASK_BAR_SPACING))
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def barRect(self, row):
+        return QRect(0, row * (TASK_BAR_HEIGHT + TASK_BAR_SPACING), self.width(), TASK_BAR_HEIGHT)
+
+    def rowAt(self, pos):
+        row, offset = divmod(pos.y(), TASK_BAR_HEIGHT + TASK_BAR_SPACING)
+        if 0 <= row < len(self.tasks) and offset < TASK_BAR_HEIGHT:
+            return row
+        return None
 
-        self.task.updated.connect(self.updateProgress)
-        self.task.focused.connect(self.updateStyle)
-        self.task.unfocused.connect(self.updateStyle)
+    def barState(self, row):
+        """(fill width, text, active) the row would be painted with now"""
+        task = self.tasks[row]
+        fillWidth = (self.width() - 2) * (100 - task.progress()) // 100
+        text = task.name
+        if row == self.hoverRow:
+            text = f"{task.name} — {FormatTimeLeft(task)}"
+        return fillWidth, text, task.active
 
-        self.setTextVisible(True)
-        self.setFormat(self.task.name)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setFixedHeight(TASK_BAR_HEIGHT)
-        self.updateStyle()
+    def paintEvent(self, a0):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        exposed = a0.rect()
+        first = max(0, exposed.top() // (TASK_BAR_HEIGHT + TASK_BAR_SPACING))
+        last = min(len(self.tasks) - 1, exposed.bottom() // (TASK_BAR_HEIGHT + TASK_BAR_SPACING))
+        textColor = self.palette().text().color()
+        for row in range(first, last + 1):
+            rect = self.barRect(row)
+            state = self.barState(row)
+            fillWidth, text, active = state
+            background, chunk = self.brushes[active]
 
-        self.setValue(100)
+            painter.setPen(self.borderPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), TASK_BAR_RADIUS, TASK_BAR_RADIUS)
+            if fillWidth > 0:
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(chunk)
+                painter.drawRoundedRect(QRectF(rect.x() + 1, rect.y() + 1, fillWidth, rect.height() - 2),
+                                        TASK_BAR_RADIUS - 1, TASK_BAR_RADIUS - 1)
+            painter.setPen(textColor)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            self.painted[row] = state
 
-    def mousePressEvent(self, event):
+    def updateRow(self, row):
+        """Repaint a row if what it shows has changed"""
+        if row is not None and 0 <= row < len(self.tasks) and self.painted.get(row) != self.barState(row):
+            self.update(self.barRect(row))
+
+    def onTick(self):
+        if not self.isVisible():
+            return
+        for task in GetClock().activeTasks:
+            self.updateRow(self.rows.get(task.id))
+
+    def onTaskEvent(self, event, data):
+        if event in ("TaskFocused", "TaskUnfocused"):
+            self.updateRow(self.rows.get(data["Id"]))
+
+    def mousePressEvent(self, a0):
+        row = self.rowAt(a0.position().toPoint())
         # Call parent callback if assigned
-        if self.parent() and hasattr(self.parent(), "setActiveTask"):
-            if self.task.active:
+        if row is not None and self.parent() and hasattr(self.parent(), "setActiveTask"):
+            task = self.tasks[row]
+            if task.active:
                 self.parent().setActiveTask(None)
             else:
-                self.parent().setActiveTask(self.task)
-        super().mousePressEvent(event)
-
-    def formatTime(self):
-        msLeft = self.task.durationMs - self.task.elapsedTimeMs
-        seconds = msLeft // 1000
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        days, hours = divmod(hours, 24)
-
-        time = f"{seconds:02}"
-        if days > 0:
-            time = f"{days}:{hours:02}:{minutes:02}:{seconds:02}"
-        elif hours > 0:
-            time = f"{hours:02}:{minutes:02}:{seconds:02}"
-        elif minutes > 0:
-            time = f"{minutes:02}:{seconds:02}"
-
-        return time
-
-    def updateProgress(self):
-        self.setValue(100 - self.task.progress())
-        if self.underMouse():
-            self.setFormat(f"{self.task.name} — {self.formatTime()}")
-
-    def updateStyle(self):
-        """Update the bar color based on active state"""
-        if self.task.active:
-            # colored green
-            self.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #333;
-                }
-                QProgressBar::chunk {
-                    background-color: #00aa00;
-                    width: 10px;
-                }
-            """)
-        else:
-            # grayscale inactive
-            self.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #555;
-                }
-                QProgressBar::chunk {
-                    background-color: #888;
-                    width: 10px;
-                }
-            """)
-
-    def enterEvent(self, event):
-        self.setFormat(f"{self.task.name} — {self.formatTime()}")
-        return super().enterEvent(event)
+                self.parent().setActiveTask(task)
+        # Left unaccepted so the window can still be dragged by its bars
+        super().mousePressEvent(a0)
+
+    def mouseMoveEvent(self, a0):
+        self.setHoverRow(self.rowAt(a0.position().toPoint()))
+        super().mouseMoveEvent(a0)
 
     def leaveEvent(self, a0):
-        self.setFormat(self.task.name)
-        return super().leaveEvent(a0)
\ No newline at end of file
+        self.setHoverRow(None)
+        return super().leaveEvent(a0)
+
+    def setHoverRow(self, row):
+        if row == self.hoverRow:
+            return
+        previous, self.hoverRow = self.hoverRow, row
+        self.updateRow(previous)
+        self.updateRow(row)
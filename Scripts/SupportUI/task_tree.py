@@ -0,0 +1,672 @@
+import json
+
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QEvent, QRect, QTimer, pyqtSignal
+from PyQt6.QtWidgets import (QTreeView, QStyledItemDelegate, QStyleOptionViewItem,
+                            QMenu, QMessageBox)
+from PyQt6.QtGui import QAction, QColor, QFont
+
+from Scripts.Tasks.task_manager import CATEGORIES, EditTask, DeleteTask, GetTask
+from Scripts.SupportUI.task_dialog import TaskEditDialog
+from Scripts.SupportUI.category_dialog import CategoryEditDialog
+from Scripts.SupportUI.task_events import GetTaskEvents
+from Scripts.Tasks.clock import MonotonicMs
+from Scripts.Util.resource_path import resourcePath
+
+COMPLETED_COLOR = "#888888"
+# Width of the "⋯" menu button painted at the right of category and task rows
+MENU_BUTTON_WIDTH = 20
+# Which categories and completed groups are collapsed, kept between sessions
+TREE_STATE_PATH = resourcePath("sidebarState.json")
+# Rows of a category or completed group collapsed this long are released
+RELEASE_AFTER_MS = 60000
+
+
+class CategoryNode:
+    """A category row; its children are the active tasks, then the "Completed" group"""
+
+    def __init__(self, categoryId):
+        self.categoryId = categoryId
+        # Kept even once the category is deleted, views may still ask about the row
+        self.data = CATEGORIES[categoryId]
+        # Task rows are only built once the category is first expanded
+        self.loaded = False
+        self.active = []
+        self.completed = []
+        self.completedNode = CompletedNode(self)
+
+    def childCount(self):
+        return len(self.active) + (1 if self.completed else 0)
+
+    def child(self, row):
+        if row < len(self.active):
+            return self.active[row]
+        return self.completedNode
+
+
+class CompletedNode:
+    """The "Completed" group row of a category"""
+
+    def __init__(self, categoryNode):
+        self.categoryNode = categoryNode
+        # Completed rows are only shown to views once the group is first expanded
+        self.fetched = False
+
+
+class TaskNode:
+    def __init__(self, task, parent):
+        self.task = task
+        self.parent = parent  # CategoryNode or CompletedNode
+
+
+class TaskTreeModel(QAbstractItemModel):
+    """Categories, their tasks and each category's completed tasks as one tree.
+
+    Rows are plain nodes rather than widgets, so a view only pays for the rows it
+    actually paints. Batches of task_manager events insert, remove and update just
+    the rows they touch. A category's rows are built when a view first expands it
+    (fetchMore) and can be released again once it has stayed collapsed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.categoryNodes = []
+        self.categoryById = {}
+        self.taskNodes = {}  # Task id -> TaskNode
+        self.refresh()
+        GetTaskEvents().changed.connect(self.applyEvents)
+
+    def refresh(self):
+        """Rebuild every node from task_manager"""
+        self.beginResetModel()
+        self.categoryNodes = []
+        self.categoryById = {}
+        self.taskNodes = {}
+        for categoryId, categoryData in CATEGORIES.items():
+            node = CategoryNode(categoryId)
+            # An empty category has nothing to defer
+            node.loaded = not categoryData["Tasks"]
+            self.categoryNodes.append(node)
+            self.categoryById[categoryId] = node
+        self.endResetModel()
+
+    def buildTasks(self, categoryNode):
+        for task in categoryNode.data["Tasks"]:
+            if task.isFinished():
+                taskNode = TaskNode(task, categoryNode.completedNode)
+                categoryNode.completed.append(taskNode)
+            else:
+                taskNode = TaskNode(task, categoryNode)
+                categoryNode.active.append(taskNode)
+            self.taskNodes[task.id] = taskNode
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        if isinstance(node, CategoryNode):
+            return not node.loaded
+        if isinstance(node, CompletedNode):
+            return not node.fetched
+        return False
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if isinstance(node, CategoryNode) and not node.loaded:
+            self.buildTasks(node)
+            count = node.childCount()
+            if count:
+                self.beginInsertRows(parent, 0, count - 1)
+            node.loaded = True
+            if count:
+                self.endInsertRows()
+        elif isinstance(node, CompletedNode) and not node.fetched:
+            count = len(node.categoryNode.completed)
+            if count:
+                self.beginInsertRows(parent, 0, count - 1)
+            node.fetched = True
+            if count:
+                self.endInsertRows()
+
+    def release(self, index):
+        """Drop the rows under a collapsed category or completed group until it is expanded again"""
+        node = self.node(index)
+        if isinstance(node, CategoryNode) and node.loaded and node.childCount():
+            self.beginRemoveRows(index, 0, node.childCount() - 1)
+            for taskNode in node.active + node.completed:
+                self.taskNodes.pop(taskNode.task.id, None)
+            node.active = []
+            node.completed = []
+            node.completedNode.fetched = False
+            node.loaded = False
+            self.endRemoveRows()
+        elif isinstance(node, CompletedNode) and node.fetched and node.categoryNode.completed:
+            self.beginRemoveRows(index, 0, len(node.categoryNode.completed) - 1)
+            node.fetched = False
+            self.endRemoveRows()
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if isinstance(node, CategoryNode) and not node.loaded:
+            return bool(node.data["Tasks"])
+        if isinstance(node, CompletedNode):
+            return True
+        return self.rowCount(parent) > 0
+
+    def applyEvents(self, events):
+        """Patch the rows a batch of task_manager events changed"""
+        edited = {}  # Task ids in order, each repainted once for the whole batch
+        unloaded = set()  # Categories without rows whose check box may still change
+        for event, data in events:
+            if event == "Loaded":
+                self.refresh()
+                edited.clear()
+            elif event == "CategoryAdded":
+                self.addCategory(data["Id"])
+            elif event == "CategoryDeleted":
+                self.removeCategory(data["Id"])
+            elif event == "CategoryEdited":
+                node = self.categoryById.get(data["Id"])
+                if node is not None:
+                    index = self.categoryIndex(node)
+                    self.dataChanged.emit(index, index)
+            elif event in ("TaskCreated", "TaskMoved"):
+                # A batch is applied after the fact, so place the task where it is now
+                self.removeTask(data["Id"])
+                task = GetTask(data["Id"])
+                if task is not None:
+                    self.insertTask(task)
+            elif event == "TaskDeleted":
+                self.removeTask(data["Id"])
+            elif event in ("TaskEdited", "TaskWorked"):
+                edited[data["Id"]] = None
+            if event.startswith("Task"):
+                for key in ("Category", "From"):
+                    node = self.categoryById.get(data.get(key))
+                    if node is not None and not node.loaded:
+                        unloaded.add(node)
+        if edited:
+            unloaded.update(self.updateTasks(edited))
+        for node in unloaded:
+            if node.categoryId in self.categoryById:
+                self.checksChanged(node)
+
+    def categoryIndex(self, categoryNode):
+        return self.createIndex(self.categoryNodes.index(categoryNode), 0, categoryNode)
+
+    def completedIndex(self, categoryNode):
+        return self.createIndex(len(categoryNode.active), 0, categoryNode.completedNode)
+
+    def addCategory(self, categoryId):
+        if categoryId in self.categoryById or categoryId not in CATEGORIES:
+            return
+        node = CategoryNode(categoryId)
+        node.loaded = True
+        row = len(self.categoryNodes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.categoryNodes.append(node)
+        self.categoryById[categoryId] = node
+        self.endInsertRows()
+        for task in CATEGORIES[categoryId]["Tasks"]:
+            self.removeTask(task.id)
+            self.insertTask(task)
+
+    def removeCategory(self, categoryId):
+        node = self.categoryById.pop(categoryId, None)
+        if node is None:
+            return
+        row = self.categoryNodes.index(node)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.categoryNodes[row]
+        for taskNode in node.active + node.completed:
+            self.taskNodes.pop(taskNode.task.id, None)
+        self.endRemoveRows()
+
+    def insertTask(self, task):
+        """Add a row for the task at the end of its category or its completed group"""
+        categoryNode = self.categoryById.get(task.categoryId)
+        if categoryNode is None:
+            return
+        if not categoryNode.loaded:
+            # Built with the rest of the category when it is expanded
+            self.checksChanged(categoryNode)
+            return
+        categoryIndex = self.categoryIndex(categoryNode)
+        notify = True
+        if not task.isFinished():
+            row = len(categoryNode.active)
+            taskNode = TaskNode(task, categoryNode)
+            self.beginInsertRows(categoryIndex, row, row)
+            categoryNode.active.append(taskNode)
+        elif categoryNode.completed:
+            row = len(categoryNode.completed)
+            taskNode = TaskNode(task, categoryNode.completedNode)
+            notify = categoryNode.completedNode.fetched
+            if notify:
+                self.beginInsertRows(self.completedIndex(categoryNode), row, row)
+            categoryNode.completed.append(taskNode)
+        else:
+            # The first completed task brings the group row with it
+            row = len(categoryNode.active)
+            taskNode = TaskNode(task, categoryNode.completedNode)
+            categoryNode.completedNode.fetched = False
+            self.beginInsertRows(categoryIndex, row, row)
+            categoryNode.completed.append(taskNode)
+        self.taskNodes[task.id] = taskNode
+        if notify:
+            self.endInsertRows()
+        self.checksChanged(categoryNode)
+
+    def removeTask(self, taskId):
+        taskNode = self.taskNodes.pop(taskId, None)
+        if taskNode is None:
+            return
+        parent = taskNode.parent
+        if isinstance(parent, CategoryNode):
+            categoryNode = parent
+            row = categoryNode.active.index(taskNode)
+            self.beginRemoveRows(self.categoryIndex(categoryNode), row, row)
+            del categoryNode.active[row]
+        else:
+            categoryNode = parent.categoryNode
+            row = categoryNode.completed.index(taskNode)
+            if len(categoryNode.completed) == 1:
+                # The group row goes with its last task
+                groupRow = len(categoryNode.active)
+                self.beginRemoveRows(self.categoryIndex(categoryNode), groupRow, groupRow)
+            elif parent.fetched:
+                self.beginRemoveRows(self.completedIndex(categoryNode), row, row)
+            else:
+                del categoryNode.completed[row]
+                self.checksChanged(categoryNode)
+                return
+            del categoryNode.completed[row]
+        self.endRemoveRows()
+        if categoryNode.childCount():
+            self.checksChanged(categoryNode)
+
+    def updateTasks(self, taskIds):
+        """Repaint edited task rows, moving those that became completed or active again
+
+        Returns the unloaded categories the edited tasks belong to.
+        """
+        touched = {}  # Parent node -> its edited task nodes
+        unloaded = set()
+        for taskId in taskIds:
+            taskNode = self.taskNodes.get(taskId)
+            if taskNode is None:
+                task = GetTask(taskId)
+                node = self.categoryById.get(task.categoryId) if task is not None else None
+                if node is not None and not node.loaded:
+                    unloaded.add(node)
+                continue
+            if taskNode.task.isFinished() != isinstance(taskNode.parent, CompletedNode):
+                self.removeTask(taskId)
+                self.insertTask(taskNode.task)
+            else:
+                touched.setdefault(taskNode.parent, []).append(taskNode)
+
+        categoryNodes = set()
+        for parent, taskNodes in touched.items():
+            if isinstance(parent, CategoryNode):
+                categoryNode, children = parent, parent.active
+                parentIndex = self.categoryIndex(parent)
+            else:
+                categoryNode, children = parent.categoryNode, parent.categoryNode.completed
+                parentIndex = self.completedIndex(categoryNode)
+            categoryNodes.add(categoryNode)
+            if isinstance(parent, CompletedNode) and not parent.fetched:
+                continue
+            if len(taskNodes) == 1:
+                rows = [children.index(taskNodes[0])]
+            else:
+                positions = {node: row for row, node in enumerate(children)}
+                rows = [positions[node] for node in taskNodes]
+            self.dataChanged.emit(self.index(min(rows), 0, parentIndex), self.index(max(rows), 0, parentIndex))
+        for categoryNode in categoryNodes:
+            self.checksChanged(categoryNode)
+        return unloaded
+
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else None
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        node = self.node(parent)
+        if node is None:
+            return self.createIndex(row, column, self.categoryNodes[row])
+        if isinstance(node, CategoryNode):
+            return self.createIndex(row, column, node.child(row))
+        return self.createIndex(row, column, node.categoryNode.completed[row])
+
+    def parent(self, index):
+        node = self.node(index)
+        if node is None or isinstance(node, CategoryNode):
+            return QModelIndex()
+        if isinstance(node, CompletedNode):
+            categoryNode = node.categoryNode
+            return self.createIndex(self.categoryNodes.index(categoryNode), 0, categoryNode)
+        parent = node.parent
+        if isinstance(parent, CategoryNode):
+            return self.createIndex(self.categoryNodes.index(parent), 0, parent)
+        return self.createIndex(len(parent.categoryNode.active), 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        if node is None:
+            return len(self.categoryNodes)
+        if isinstance(node, CategoryNode):
+            return node.childCount() if node.loaded else 0
+        if isinstance(node, CompletedNode):
+            return len(node.categoryNode.completed) if node.fetched else 0
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    def _checkState(self, tasks):
+        shown = sum(1 for task in tasks if task.show)
+        if shown == len(tasks):
+            return Qt.CheckState.Checked
+        return Qt.CheckState.Unchecked if shown == 0 else Qt.CheckState.PartiallyChecked
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        node = self.node(index)
+        if node is None:
+            return None
+
+        if isinstance(node, CategoryNode):
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+                return node.data["Name"]
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor(str(node.data["Color"]))
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return self._checkState(node.data["Tasks"])
+            return None
+
+        if isinstance(node, CompletedNode):
+            if role == Qt.ItemDataRole.DisplayRole:
+                return "Completed"
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor(COMPLETED_COLOR)
+            if role == Qt.ItemDataRole.FontRole:
+                return QFont("Arial", 9)
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return self._checkState([child.task for child in node.categoryNode.completed])
+            return None
+
+        task = node.task
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return task.name
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if task.show else Qt.CheckState.Unchecked
+        if isinstance(node.parent, CompletedNode):
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor(COMPLETED_COLOR)
+            if role == Qt.ItemDataRole.FontRole:
+                font = QFont()
+                font.setStrikeOut(True)
+                return font
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        node = self.node(index)
+        if node is None or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        show = Qt.CheckState(value) != Qt.CheckState.Unchecked
+        if isinstance(node, CategoryNode):
+            tasks = list(node.data["Tasks"])
+        elif isinstance(node, CompletedNode):
+            tasks = [child.task for child in node.categoryNode.completed]
+        else:
+            tasks = [node.task]
+        for task in tasks:
+            EditTask(task, show=show)
+        # The rows are repainted once the edits come back as TaskEdited events
+        return True
+
+    def checksChanged(self, categoryNode):
+        """Tell views the category's and its completed group's check boxes may have changed"""
+        roles = [Qt.ItemDataRole.CheckStateRole]
+        categoryIndex = self.categoryIndex(categoryNode)
+        self.dataChanged.emit(categoryIndex, categoryIndex, roles)
+        if categoryNode.completed:
+            completedIndex = self.completedIndex(categoryNode)
+            self.dataChanged.emit(completedIndex, completedIndex, roles)
+
+
+class TaskTreeDelegate(QStyledItemDelegate):
+    """Draws rows as usual, plus a "⋯" button opening the row's menu"""
+    menu_requested = pyqtSignal(QModelIndex, object)  # (index, global position)
+
+    def has_menu(self, index):
+        return not isinstance(index.internalPointer(), CompletedNode)
+
+    def button_rect(self, option):
+        rect = option.rect
+        return QRect(rect.right() - MENU_BUTTON_WIDTH + 1, rect.top(), MENU_BUTTON_WIDTH, rect.height())
+
+    def paint(self, painter, option, index):
+        if not self.has_menu(index):
+            super().paint(painter, option, index)
+            return
+        # Leave room for the button so long names elide before it
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect = option.rect.adjusted(0, 0, -MENU_BUTTON_WIDTH, 0)
+        super().paint(painter, text_option, index)
+        painter.save()
+        painter.setPen(option.palette.text().color())
+        painter.drawText(self.button_rect(option), Qt.AlignmentFlag.AlignCenter, "⋯")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease and self.has_menu(index)
+                and self.button_rect(option).contains(event.position().toPoint())):
+            self.menu_requested.emit(index, event.globalPosition().toPoint())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class TaskTreeView(QTreeView):
+    """Sidebar tree of categories and tasks with their edit/delete/complete menus"""
+    category_deleted = pyqtSignal(int)  # Emits category ID
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setModel(TaskTreeModel(self))
+        self.delegate = TaskTreeDelegate(self)
+        self.delegate.menu_requested.connect(self.show_menu)
+        self.setItemDelegate(self.delegate)
+        self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+        self.setIndentation(15)
+        self.setTextElideMode(Qt.TextElideMode.ElideRight)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(
+            lambda position: self.show_menu(self.indexAt(position), self.viewport().mapToGlobal(position))
+        )
+
+        # Category ids whose row or "Completed" group the user collapsed
+        self.collapsed_categories = set()
+        self.collapsed_completed = set()
+        self.load_state()
+        # (category id, is completed group) -> when it was collapsed
+        self.collapsed_at = {}
+        self.release_timer = QTimer(self)
+        self.release_timer.setSingleShot(True)
+        self.release_timer.timeout.connect(self.release_collapsed)
+
+        self.expanded.connect(lambda index: self.set_collapsed(index, False))
+        self.collapsed.connect(lambda index: self.set_collapsed(index, True))
+        self.model().modelReset.connect(self.restore_expansion)
+        self.model().rowsInserted.connect(self.expand_inserted)
+        self.restore_expansion()
+
+    def refresh(self):
+        """Rebuild the tree from task_manager"""
+        self.model().refresh()
+
+    def load_state(self):
+        try:
+            with open(TREE_STATE_PATH, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self.collapsed_categories = set(state.get("CollapsedCategories", []))
+        self.collapsed_completed = set(state.get("CollapsedCompleted", []))
+
+    def save_state(self):
+        state = {
+            "CollapsedCategories": sorted(self.collapsed_categories),
+            "CollapsedCompleted": sorted(self.collapsed_completed),
+        }
+        try:
+            with open(TREE_STATE_PATH, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError:
+            pass
+
+    def is_collapsed(self, index):
+        node = index.internalPointer()
+        if isinstance(node, CategoryNode):
+            return node.categoryId in self.collapsed_categories
+        if isinstance(node, CompletedNode):
+            return node.categoryNode.categoryId in self.collapsed_completed
+        return True
+
+    def set_collapsed(self, index, collapsed):
+        """Remember a category or group the user opened or closed"""
+        node = index.internalPointer()
+        if isinstance(node, CategoryNode):
+            key, collapsed_ids = (node.categoryId, False), self.collapsed_categories
+        elif isinstance(node, CompletedNode):
+            key, collapsed_ids = (node.categoryNode.categoryId, True), self.collapsed_completed
+        else:
+            return
+        if collapsed:
+            self.collapsed_at[key] = MonotonicMs()
+            if not self.release_timer.isActive():
+                self.release_timer.start(RELEASE_AFTER_MS)
+        else:
+            self.collapsed_at.pop(key, None)
+        if (key[0] in collapsed_ids) != collapsed:
+            if collapsed:
+                collapsed_ids.add(key[0])
+            else:
+                collapsed_ids.discard(key[0])
+            self.save_state()
+
+    def release_collapsed(self):
+        """Free the rows of everything that has stayed collapsed for RELEASE_AFTER_MS"""
+        model = self.model()
+        now = MonotonicMs()
+        for key, collapsed_at in list(self.collapsed_at.items()):
+            if now - collapsed_at < RELEASE_AFTER_MS:
+                continue
+            del self.collapsed_at[key]
+            category_id, is_group = key
+            category_node = model.categoryById.get(category_id)
+            if category_node is None:
+                continue
+            if is_group:
+                if not category_node.loaded or not category_node.completed:
+                    continue
+                index = model.completedIndex(category_node)
+            else:
+                index = model.categoryIndex(category_node)
+            if not self.isExpanded(index):
+                model.release(index)
+        if self.collapsed_at:
+            oldest = min(self.collapsed_at.values())
+            self.release_timer.start(max(0, RELEASE_AFTER_MS - (now - oldest)))
+
+    def restore_expansion(self):
+        """Expand every category the user left open, building only those rows"""
+        self.collapsed_at.clear()
+        self.expand_inserted(QModelIndex(), 0, self.model().rowCount() - 1)
+
+    def expand_inserted(self, parent, first, last):
+        """Open new categories and completed groups unless the user collapsed them"""
+        model = self.model()
+        for row in range(first, last + 1):
+            index = model.index(row, 0, parent)
+            if not self.is_collapsed(index):
+                self.expand(index)
+
+    def show_menu(self, index, global_position):
+        """Show the edit menu of a category or task row"""
+        node = index.internalPointer() if index.isValid() else None
+        menu = QMenu(self)
+        if isinstance(node, CategoryNode):
+            edit_action = QAction("Edit Category", self)
+            edit_action.triggered.connect(lambda: self.edit_category(node.categoryId))
+            menu.addAction(edit_action)
+
+            delete_action = QAction("Delete Category", self)
+            delete_action.triggered.connect(lambda: self.delete_category(node.categoryId))
+            menu.addAction(delete_action)
+        elif isinstance(node, TaskNode):
+            task = node.task
+            edit_action = QAction("Edit Task", self)
+            edit_action.triggered.connect(lambda: self.edit_task(task))
+            menu.addAction(edit_action)
+
+            delete_action = QAction("Delete Task", self)
+            delete_action.triggered.connect(lambda: self.delete_task(task))
+            menu.addAction(delete_action)
+
+            if not task.isFinished():
+                complete_action = QAction("Mark Complete", self)
+                complete_action.triggered.connect(lambda: self.mark_complete(task))
+                menu.addAction(complete_action)
+        else:
+            return
+        menu.exec(global_position)
+
+    def edit_category(self, category_id):
+        """Open category edit dialog"""
+        dialog = CategoryEditDialog(category_id, CATEGORIES[category_id], self)
+        dialog.exec()
+
+    def delete_category(self, category_id):
+        """Delete category with confirmation"""
+        category_data = CATEGORIES[category_id]
+        if category_data["Tasks"]:
+            QMessageBox.warning(self, "Cannot Delete",
+                              "Cannot delete category with tasks. Move or delete tasks first.")
+            return
+
+        reply = QMessageBox.question(self, "Delete Category",
+                                   f"Are you sure you want to delete '{category_data['Name']}'?",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.category_deleted.emit(category_id)
+
+    def edit_task(self, task):
+        """Open task edit dialog"""
+        dialog = TaskEditDialog(task, self)
+        dialog.exec()
+
+    def delete_task(self, task):
+        """Delete task with confirmation"""
+        reply = QMessageBox.question(self, "Delete Task",
+                                   f"Are you sure you want to delete '{task.name}'?",
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            DeleteTask(task)
+
+    def mark_complete(self, task):
+        """Mark task as complete"""
+        EditTask(task, elapsedMs=task.durationMs)
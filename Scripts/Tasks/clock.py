@@ -0,0 +1,55 @@
+import time
+
+TICK_INTERVAL_MS = 100
+
+
+def MonotonicMs():
+    return time.monotonic_ns() // 1_000_000
+
+
+class TaskClock:
+    """App-wide ticker shared by every focused task.
+
+    Tasks compute their elapsed time from a monotonic timestamp, so the tick only
+    tells views when to repaint; a stalled event loop never loses time. The clock
+    itself has no timer: a driver (the Qt one lives in qt_adapters) calls onTick
+    while tasks are active. Without one, time is still counted, nothing repaints.
+    """
+
+    def __init__(self):
+        self.activeTasks = []
+        self.driver = None
+        # Callbacks run after every tick
+        self.listeners = []
+
+    def setDriver(self, driver):
+        self.driver = driver
+        if self.activeTasks:
+            driver.start(TICK_INTERVAL_MS)
+
+    def attach(self, task):
+        if task not in self.activeTasks:
+            self.activeTasks.append(task)
+        if self.driver is not None:
+            self.driver.start(TICK_INTERVAL_MS)
+
+    def detach(self, task):
+        if task in self.activeTasks:
+            self.activeTasks.remove(task)
+        if not self.activeTasks and self.driver is not None:
+            self.driver.stop()
+
+    def onTick(self):
+        for task in list(self.activeTasks):
+            task.tick()
+        for callback in list(self.listeners):
+            callback()
+
+
+_CLOCK = None
+
+def GetClock():
+    global _CLOCK
+    if _CLOCK is None:
+        _CLOCK = TaskClock()
+    return _CLOCK
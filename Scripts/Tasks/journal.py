@@ -0,0 +1,91 @@
+import json
+import os
+
+from Scripts.Tasks.task_manager import ApplyEvent
+
+# Pending events are written and fsync'd together once this many pile up
+JOURNAL_BATCH_SIZE = 64
+
+
+class Journal:
+    """Append-only log of task manager events, one JSON object per line.
+
+    Every event carries an increasing sequence number so events already folded
+    into a snapshot can be skipped on replay.
+    """
+
+    def __init__(self, path, seq=0):
+        self.path = path
+        self.seq = seq
+        self.pending = []
+        self.file = None
+
+    def record(self, event, data):
+        self.seq += 1
+        entry = {"Seq": self.seq, "Event": event, **data}
+        self.pending.append(json.dumps(entry, separators=(",", ":")))
+        if len(self.pending) >= JOURNAL_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        lines = "\n".join(self.pending) + "\n"
+        if self.file is None:
+            self.file = open(self.path, "a", encoding="utf-8")
+            # A crash mid-write can leave a torn last line, start after it instead of on it
+            if self._endsTorn():
+                lines = "\n" + lines
+        self.file.write(lines)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending.clear()
+
+    def _endsTorn(self):
+        with open(self.path, "rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def reset(self):
+        """Drop everything written so far, once a snapshot covers it"""
+        self.pending.clear()
+        self.close()
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def ReplayJournal(path, afterSeq=0):
+    """Apply journaled events newer than afterSeq and return the last sequence number"""
+    seq = afterSeq
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return seq
+
+    with f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A torn write from a crash, later sessions carry on after it on a new line
+                continue
+            entrySeq = entry.pop("Seq")
+            event = entry.pop("Event")
+            if entrySeq <= afterSeq:
+                continue
+            ApplyEvent(event, entry)
+            seq = entrySeq
+    return seq
@@ -0,0 +1,39 @@
+"""Qt objects layered over the Qt-free task core"""
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from Scripts.Tasks.clock import GetClock
+
+
+class QtClock(QObject):
+    """Drives the shared TaskClock from a QTimer and re-emits its ticks as a signal"""
+    tick = pyqtSignal()
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.timeout.connect(clock.onTick)
+        clock.listeners.append(self.tick.emit)
+        clock.setDriver(self)
+
+    @property
+    def activeTasks(self):
+        return self.clock.activeTasks
+
+    def start(self, intervalMs):
+        if not self.timer.isActive():
+            self.timer.start(intervalMs)
+
+    def stop(self):
+        self.timer.stop()
+
+
+_QT_CLOCK = None
+
+def GetQtClock():
+    """The Qt face of GetClock(), its tick signal fires while any task is focused"""
+    global _QT_CLOCK
+    if _QT_CLOCK is None:
+        _QT_CLOCK = QtClock(GetClock())
+    return _QT_CLOCK
@@ -0,0 +1,143 @@
+import gzip
+import json
+import os
+
+from Scripts.Tasks.task_manager import CATEGORIES, GetNextCategoryId, GetTask, LoadAll
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _WriteDurably(path, writeFn, compress=False):
+    """Write a file next to its final path and swap it in once it is on disk"""
+    tmpPath = path + ".tmp"
+    opener = gzip.open if compress else open
+    with opener(tmpPath, "wt", encoding="utf-8") as f:
+        writeFn(f)
+    with open(tmpPath, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(tmpPath, path)
+
+
+class SegmentedStore:
+    """Saves each category to its own gzip segment and rewrites only dirty ones.
+
+    Segments are never overwritten in place: changed categories go to new files and
+    the manifest is swapped to point at them, so a crash mid-save leaves the
+    previous manifest and segments intact.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.generation = 0
+        self.segments = {}
+        # Serialized form of every task, reused until the task changes
+        self.taskData = {}
+        self.dirtyCategories = set()
+        self.dirtyTasks = set()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def load(self):
+        """Load the saved categories and return the journal sequence they cover, None if nothing is saved"""
+        try:
+            with open(self._path(MANIFEST_NAME), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        self.generation = manifest["Generation"]
+        self.segments = {int(id): name for id, name in manifest["Segments"].items()}
+        data = []
+        for id in manifest["Order"]:
+            with gzip.open(self._path(self.segments[id]), "rt", encoding="utf-8") as f:
+                categoryData = json.load(f)
+            for taskData in categoryData["Tasks"]:
+                self.taskData[taskData["Id"]] = taskData
+            data.append(categoryData)
+        # Saves from before the counter was kept fall back to the highest id in use
+        LoadAll(data, manifest.get("NextCategoryId", 0))
+        self.dirtyCategories.clear()
+        self.dirtyTasks.clear()
+        return manifest["Seq"]
+
+    def markAllDirty(self):
+        self.taskData.clear()
+        self.dirtyCategories.update(CATEGORIES.keys())
+
+    def isDirty(self):
+        return bool(self.dirtyCategories) or set(self.segments) != set(CATEGORIES)
+
+    def onEvent(self, event, data):
+        if event == "Loaded":
+            self.markAllDirty()
+        elif event.startswith("Category"):
+            self.dirtyCategories.add(data["Id"])
+        elif event in ("TaskFocused", "TaskUnfocused"):
+            return
+        else:
+            taskId = data["Id"]
+            self.dirtyTasks.add(taskId)
+            if event == "TaskDeleted":
+                self.taskData.pop(taskId, None)
+                self.dirtyCategories.add(data["Category"])
+            elif event == "TaskMoved":
+                self.dirtyCategories.update((data["Category"], data["From"]))
+            elif "Category" in data:
+                self.dirtyCategories.add(data["Category"])
+            else:
+                task = GetTask(taskId)
+                if task is not None:
+                    self.dirtyCategories.add(task.categoryId)
+
+    def _segmentData(self, categoryId):
+        category = CATEGORIES[categoryId]
+        tasks = []
+        for task in category["Tasks"]:
+            if task.id in self.dirtyTasks or task.id not in self.taskData:
+                self.taskData[task.id] = task.getSaveData()
+            tasks.append(self.taskData[task.id])
+        return {
+            "Id": categoryId,
+            "Name": category["Name"],
+            "Description": category["Description"],
+            "Color": str(category["Color"]),
+            "Tasks": tasks,
+        }
+
+    def save(self, seq):
+        """Write dirty categories and a manifest covering journal events up to seq"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.generation += 1
+        segments = {}
+        for id in CATEGORIES.keys():
+            if id in self.segments and id not in self.dirtyCategories:
+                segments[id] = self.segments[id]
+                continue
+            name = f"category_{id}.{self.generation}.json.gz"
+            categoryData = self._segmentData(id)
+            _WriteDurably(self._path(name), lambda f: json.dump(categoryData, f, separators=(",", ":")), compress=True)
+            segments[id] = name
+        stale = [name for id, name in self.segments.items() if segments.get(id) != name]
+
+        manifest = {
+            "Seq": seq,
+            "NextCategoryId": GetNextCategoryId(),
+            "Generation": self.generation,
+            "Order": list(CATEGORIES.keys()),
+            "Segments": {str(id): name for id, name in segments.items()},
+        }
+        _WriteDurably(self._path(MANIFEST_NAME), lambda f: json.dump(manifest, f))
+
+        for name in stale:
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+        self.segments = segments
+        self.dirtyCategories.clear()
+        self.dirtyTasks.clear()
+
+    def close(self):
+        # Segments are closed as soon as they are written
+        pass
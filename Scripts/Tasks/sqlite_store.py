@@ -0,0 +1,278 @@
+import os
+import sqlite3
+from collections import defaultdict
+
+from Scripts.Tasks.task_manager import CATEGORIES, GetNextCategoryId, GetTask, LoadAll
+
+SCHEMA_VERSION = 1
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    color TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    category INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    show INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    elapsed_ms INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_category ON tasks (category);
+CREATE TABLE IF NOT EXISTS daily_work (
+    task INTEGER NOT NULL,
+    category INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    ms INTEGER NOT NULL,
+    PRIMARY KEY (task, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_work_by_category ON daily_work (category, day);
+CREATE TABLE IF NOT EXISTS sessions (
+    task INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    PRIMARY KEY (task, n)
+) WITHOUT ROWID;
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+class SqliteStore:
+    """Saves tasks to an SQLite database in WAL mode and writes only the rows that changed.
+
+    Daily work is one row per task and day, keyed by (task, day) and indexed by
+    (category, day), so range queries never scan the whole history and other
+    tools can read the file while the app has it open. Rows are kept in the
+    order task_manager holds them through an increasing position, tasks only
+    ever being appended to a category.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = None
+        self.fullWrite = False
+        self.dirtyCategories = set()
+        self.deletedCategories = set()
+        # Tasks whose row changed, a task that no longer exists has its rows deleted
+        self.dirtyTasks = set()
+        # Categories and tasks added or moved since the last save, in the order it happened
+        self.placedCategories = {}
+        self.placedTasks = {}
+        # Task id -> days whose work changed
+        self.workedDays = {}
+        # Task id -> sessions already written, only the last of them can still grow
+        self.savedSessions = {}
+        self.nextCategoryPosition = 0
+        self.nextTaskPosition = 0
+
+    def _connect(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            # A save must be on disk once committed, the event journal is reset after it
+            self.connection.execute("PRAGMA synchronous = FULL")
+            self.connection.executescript(SCHEMA)
+        return self.connection
+
+    def load(self):
+        """Load the saved categories and return the journal sequence they cover, None if nothing is saved"""
+        if not os.path.exists(self.path):
+            return None
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM meta WHERE key = 'Seq'").fetchone()
+        if row is None:
+            return None
+
+        dailyWork = defaultdict(dict)
+        for taskId, day, ms in connection.execute("SELECT task, day, ms FROM daily_work"):
+            dailyWork[taskId][day] = ms
+        sessions = defaultdict(list)
+        for taskId, start, end in connection.execute("SELECT task, start_ms, end_ms FROM sessions ORDER BY task, n"):
+            sessions[taskId].append([start, end])
+
+        categories = {}
+        for id, name, description, color in connection.execute(
+                "SELECT id, name, description, color FROM categories ORDER BY position"):
+            categories[id] = {"Id": id, "Name": name, "Description": description, "Color": color, "Tasks": []}
+        for id, categoryId, name, show, duration, elapsed in connection.execute(
+                "SELECT id, category, name, show, duration_ms, elapsed_ms FROM tasks ORDER BY position"):
+            categories[categoryId]["Tasks"].append({
+                "Id": id,
+                "Name": name,
+                "Show": bool(show),
+                "Category": categoryId,
+                "Duration": duration,
+                "Elapsed": elapsed,
+                "DailyWorkMs": dailyWork.get(id, {}),
+                "Sessions": sessions.get(id, []),
+            })
+        nextCategoryId = connection.execute("SELECT value FROM meta WHERE key = 'NextCategoryId'").fetchone()
+        LoadAll(list(categories.values()), nextCategoryId[0] if nextCategoryId else 0)
+
+        self.nextCategoryPosition = connection.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM categories").fetchone()[0]
+        self.nextTaskPosition = connection.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM tasks").fetchone()[0]
+        self.savedSessions = {taskId: len(taskSessions) for taskId, taskSessions in sessions.items()}
+        self._clearDirty()
+        return row[0]
+
+    def markAllDirty(self):
+        self.fullWrite = True
+
+    def isDirty(self):
+        return (self.fullWrite or bool(self.dirtyCategories) or bool(self.deletedCategories)
+                or bool(self.dirtyTasks))
+
+    def onEvent(self, event, data):
+        if event == "Loaded":
+            self.markAllDirty()
+        elif event == "CategoryAdded":
+            self.dirtyCategories.add(data["Id"])
+            self.placedCategories[data["Id"]] = None
+        elif event == "CategoryEdited":
+            self.dirtyCategories.add(data["Id"])
+        elif event == "CategoryDeleted":
+            self.deletedCategories.add(data["Id"])
+            self.dirtyCategories.discard(data["Id"])
+            self.placedCategories.pop(data["Id"], None)
+        elif event in ("TaskFocused", "TaskUnfocused"):
+            return
+        else:
+            taskId = data["Id"]
+            self.dirtyTasks.add(taskId)
+            if event in ("TaskCreated", "TaskMoved"):
+                # Moved tasks go to the end of their new category
+                self.placedTasks.pop(taskId, None)
+                self.placedTasks[taskId] = None
+            elif event == "TaskWorked":
+                self.workedDays.setdefault(taskId, set()).update(data["Days"])
+
+    def save(self, seq):
+        """Write the changed rows and the journal sequence they cover in one transaction"""
+        connection = self._connect()
+        with connection:
+            if self.fullWrite:
+                self._writeAll(connection)
+            else:
+                self._writeChanges(connection)
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (("Seq", seq), ("NextCategoryId", GetNextCategoryId())))
+        self._clearDirty()
+
+    def _clearDirty(self):
+        self.fullWrite = False
+        self.dirtyCategories.clear()
+        self.deletedCategories.clear()
+        self.dirtyTasks.clear()
+        self.placedCategories.clear()
+        self.placedTasks.clear()
+        self.workedDays.clear()
+
+    def _writeAll(self, connection):
+        for table in ("categories", "tasks", "daily_work", "sessions"):
+            connection.execute(f"DELETE FROM {table}")
+        connection.executemany(
+            "INSERT INTO categories (id, position, name, description, color) VALUES (?, ?, ?, ?, ?)",
+            ((id, position, category["Name"], category["Description"], str(category["Color"]))
+             for position, (id, category) in enumerate(CATEGORIES.items())))
+        tasks = [task for category in CATEGORIES.values() for task in category["Tasks"]]
+        connection.executemany(
+            "INSERT INTO tasks (id, category, position, name, show, duration_ms, elapsed_ms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self._taskRow(task, position) for position, task in enumerate(tasks)))
+        connection.executemany(
+            "INSERT INTO daily_work (task, category, day, ms) VALUES (?, ?, ?, ?)",
+            ((task.id, task.categoryId, day, ms) for task in tasks for day, ms in task.dailyWork.items()))
+        connection.executemany(
+            "INSERT INTO sessions (task, n, start_ms, end_ms) VALUES (?, ?, ?, ?)",
+            ((task.id, n, start, end) for task in tasks for n, (start, end) in enumerate(task.sessions)))
+        self.nextCategoryPosition = len(CATEGORIES)
+        self.nextTaskPosition = len(tasks)
+        self.savedSessions = {task.id: len(task.sessions) for task in tasks}
+
+    def _writeChanges(self, connection):
+        for id in self.placedCategories:
+            category = CATEGORIES[id]
+            connection.execute(
+                "INSERT INTO categories (id, position, name, description, color) VALUES (?, ?, ?, ?, ?)",
+                (id, self.nextCategoryPosition, category["Name"], category["Description"], str(category["Color"])))
+            self.nextCategoryPosition += 1
+        for id in self.dirtyCategories.difference(self.placedCategories):
+            category = CATEGORIES[id]
+            connection.execute(
+                "UPDATE categories SET name = ?, description = ?, color = ? WHERE id = ?",
+                (category["Name"], category["Description"], str(category["Color"]), id))
+
+        positions = {}
+        for taskId in self.placedTasks:
+            positions[taskId] = self.nextTaskPosition
+            self.nextTaskPosition += 1
+        for taskId in self.dirtyTasks:
+            task = GetTask(taskId)
+            if task is None:
+                # Deleted, on its own or with the category it was last in
+                connection.execute("DELETE FROM tasks WHERE id = ?", (taskId,))
+                connection.execute("DELETE FROM daily_work WHERE task = ?", (taskId,))
+                connection.execute("DELETE FROM sessions WHERE task = ?", (taskId,))
+                self.savedSessions.pop(taskId, None)
+                continue
+            if taskId in positions:
+                connection.execute(
+                    "INSERT OR REPLACE INTO tasks (id, category, position, name, show, duration_ms, elapsed_ms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._taskRow(task, positions[taskId]))
+                connection.execute("UPDATE daily_work SET category = ? WHERE task = ?", (task.categoryId, taskId))
+            else:
+                connection.execute(
+                    "UPDATE tasks SET name = ?, show = ?, duration_ms = ?, elapsed_ms = ? WHERE id = ?",
+                    (task.name, task.show, task.durationMs, task.committedMs, taskId))
+            if taskId in self.workedDays:
+                self._writeWork(connection, task, self.workedDays[taskId])
+
+        # Only after tasks moved out of them have been rewritten under their new category
+        for id in self.deletedCategories:
+            connection.execute("DELETE FROM sessions WHERE task IN (SELECT id FROM tasks WHERE category = ?)", (id,))
+            connection.execute("DELETE FROM daily_work WHERE category = ?", (id,))
+            connection.execute("DELETE FROM tasks WHERE category = ?", (id,))
+            connection.execute("DELETE FROM categories WHERE id = ?", (id,))
+
+    def _writeWork(self, connection, task, days):
+        connection.executemany(
+            "INSERT INTO daily_work (task, category, day, ms) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (task, day) DO UPDATE SET ms = excluded.ms, category = excluded.category",
+            ((task.id, task.categoryId, day, task.dailyWork[day]) for day in days))
+        # Sessions are only appended, or the last one extended by a checkpoint
+        first = max(0, self.savedSessions.get(task.id, 0) - 1)
+        connection.executemany(
+            "INSERT OR REPLACE INTO sessions (task, n, start_ms, end_ms) VALUES (?, ?, ?, ?)",
+            ((task.id, n, start, end) for n, (start, end) in enumerate(task.sessions[first:], first)))
+        self.savedSessions[task.id] = len(task.sessions)
+
+    @staticmethod
+    def _taskRow(task, position):
+        # Only committed time is saved, a running session reaches the journal through checkpoints
+        return (task.id, task.categoryId, position, task.name, task.show, task.durationMs, task.committedMs)
+
+    def categoryWork(self, categoryId, startDay, endDay):
+        """Saved milliseconds per "yyyy-MM-dd" day of a category, from the (category, day) index"""
+        return dict(self._connect().execute(
+            "SELECT day, SUM(ms) FROM daily_work WHERE category = ? AND day BETWEEN ? AND ? GROUP BY day ORDER BY day",
+            (categoryId, startDay, endDay)))
+
+    def taskWork(self, taskId, startDay, endDay):
+        """Saved milliseconds per "yyyy-MM-dd" day of a task, from the (task, day) key"""
+        return dict(self._connect().execute(
+            "SELECT day, ms FROM daily_work WHERE task = ? AND day BETWEEN ? AND ? ORDER BY day",
+            (taskId, startDay, endDay)))
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
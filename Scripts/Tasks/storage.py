@@ -0,0 +1,61 @@
+import sys
+
+from Scripts.Tasks.save_store import SegmentedStore
+from Scripts.Tasks.sqlite_store import SqliteStore
+from Scripts.Util.resource_path import resourcePath
+
+# Backend name -> (store class, where it keeps its data next to the app). Every store
+# follows task_manager through onEvent(event, data) and provides load(), returning
+# the journal sequence it covers or None when nothing is saved, markAllDirty(),
+# isDirty(), save(seq) and close().
+STORAGE_BACKENDS = {
+    "SQLite": (SqliteStore, "taskSaveData.db"),
+    "GzipJson": (SegmentedStore, "taskSaveData"),
+}
+DEFAULT_STORAGE_BACKEND = "SQLite"
+# Picks the backend on the command line, e.g. --storage=GzipJson
+STORAGE_FLAG = "--storage="
+
+
+def CreateStore(backend):
+    storeClass, name = STORAGE_BACKENDS[backend]
+    return storeClass(resourcePath(name))
+
+
+def StorageBackendFromArgs(argv):
+    for arg in argv:
+        if arg.startswith(STORAGE_FLAG):
+            backend = arg[len(STORAGE_FLAG):]
+            if backend not in STORAGE_BACKENDS:
+                raise ValueError(f"Unknown storage backend {backend!r}, expected one of {', '.join(STORAGE_BACKENDS)}")
+            return backend
+    return DEFAULT_STORAGE_BACKEND
+
+
+def MigrateStore(source, target):
+    """Replace what target holds with everything source saved, return the journal sequence it covers or None.
+
+    Both stores are loaded through task_manager, so this runs before anything
+    else has been loaded or subscribed.
+    """
+    # The target's own save is loaded first so it knows what to replace
+    target.load()
+    seq = source.load()
+    if seq is None:
+        return None
+    target.markAllDirty()
+    target.save(seq)
+    return seq
+
+
+if __name__ == "__main__":
+    # One-shot copy between backends, e.g. python -m Scripts.Tasks.storage GzipJson SQLite
+    sourceName, targetName = sys.argv[1:3]
+    source, target = CreateStore(sourceName), CreateStore(targetName)
+    seq = MigrateStore(source, target)
+    source.close()
+    target.close()
+    if seq is None:
+        print(f"Nothing saved with {sourceName}")
+    else:
+        print(f"Copied {sourceName} to {targetName}, covering journal events up to {seq}")
@@ -1,64 +1,140 @@
-from PyQt6.QtCore import QTimer, pyqtSignal, QObject, QDateTime
+from datetime import datetime, time, timedelta
 
-TIMER_UPDATE_INTERVAL_MS = 100
+from Scripts.Tasks.clock import GetClock, MonotonicMs
 
-class Task(QObject):
-    focused = pyqtSignal(object)
-    unfocused = pyqtSignal(object)
-    finished = pyqtSignal(object)
-    updated = pyqtSignal(object)
+# Callbacks of the form callback(signalName, task, *args) told what every task emits
+_OBSERVERS = []
 
-    def __init__(self, name, categoryId = 1, durationMs = 0, elapsedMs = 0, dailyWork = None, show = True):
-        super().__init__()
+def ObserveTasks(callback):
+    _OBSERVERS.append(callback)
+
+
+class Task:
+    """One task's data as a compact record.
+
+    Changes are reported to the observers registered with ObserveTasks, so a
+    task holds no Qt objects of its own.
+    """
+    __slots__ = (
+        "id", "name", "show", "categoryId", "durationMs", "active",
+        "_elapsedMs", "_focusMonoMs", "startTime", "dailyWork", "sessions",
+        "sentFinishedSignal",
+    )
+
+    def __init__(self, name, categoryId = 1, durationMs = 0, elapsedMs = 0, dailyWork = None, show = True, taskId = None, sessions = None):
+        self.id = taskId
         self.name = name
         self.show = show
         self.categoryId = categoryId
         self.durationMs = durationMs
         self.active = False
-        self.elapsedTimeMs = elapsedMs
+        # Time committed by previous sessions; the running session is added on read
+        self._elapsedMs = elapsedMs
+        self._focusMonoMs = None
 
         self.startTime = None
         # Stores cumulative work per day, key = "yyyy-MM-dd", value = milliseconds
         self.dailyWork = dailyWork if dailyWork is not None else {}
+        # Focus sessions as [start, end] in ms since the epoch, oldest first
+        self.sessions = sessions if sessions is not None else []
         self.sentFinishedSignal = False
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._updateTime)
+    def _emit(self, name, *args):
+        for callback in _OBSERVERS:
+            callback(name, self, *args)
+
+    @property
+    def elapsedTimeMs(self):
+        if self.active:
+            return self._elapsedMs + MonotonicMs() - self._focusMonoMs
+        return self._elapsedMs
+
+    @elapsedTimeMs.setter
+    def elapsedTimeMs(self, value):
+        self._elapsedMs = value
+        if self.active:
+            self._focusMonoMs = MonotonicMs()
+
+    @property
+    def committedMs(self):
+        """Time of finished and checkpointed sessions, what gets saved"""
+        return self._elapsedMs
 
-    def _updateTime(self):
-        self.elapsedTimeMs += TIMER_UPDATE_INTERVAL_MS
-        self.updated.emit(self)
+    @property
+    def pendingMs(self):
+        """Time of the running session that has not been committed yet"""
+        return self.elapsedTimeMs - self._elapsedMs
+
+    def tick(self):
+        # Called by the shared clock while this task is focused
+        self._emit("updated")
         if not self.sentFinishedSignal and self.isFinished():
-            self.finished.emit(self)
+            self._emit("finished")
             self.sentFinishedSignal = True
 
     def setFocused(self, focused):
-        now = QDateTime.currentDateTime()
+        now = datetime.now()
         if focused and not self.active:
-            if not self.timer.isActive():
-                self.timer.start(TIMER_UPDATE_INTERVAL_MS)
+            self._focusMonoMs = MonotonicMs()
             self.active = True
             self.startTime = now
-            self.focused.emit(self)
-        elif self.active:
+            GetClock().attach(self)
+            self._emit("focused")
+        elif not focused and self.active:
+            self._commitSpan(now)
             self.active = False
-            self.addDailyWork(self.startTime, now)
-            self.timer.stop()
-            self.unfocused.emit(self)
+            self._focusMonoMs = None
+            GetClock().detach(self)
+            self._emit("unfocused")
+
+    def checkpoint(self):
+        """Commit the running session so far without unfocusing the task"""
+        if self.active:
+            self._commitSpan(datetime.now())
+
+    def _commitSpan(self, now: datetime):
+        nowMonoMs = MonotonicMs()
+        spanMs = nowMonoMs - self._focusMonoMs
+        self._focusMonoMs = nowMonoMs
+        span = {
+            "Start" : int(self.startTime.timestamp() * 1000),
+            "End" : int(now.timestamp() * 1000),
+            "Elapsed" : spanMs,
+            "Days" : self.splitByDay(self.startTime, now),
+        }
+        self.applyWork(span["Days"], spanMs, span["Start"], span["End"])
+        self.startTime = now
+        self._emit("worked", span)
+
+    def addDailyWork(self, start: datetime, end: datetime):
+        added = self.splitByDay(start, end)
+        self.applyWork(added)
+        return added
 
-    def addDailyWork(self, start: QDateTime, end: QDateTime):
+    @staticmethod
+    def splitByDay(start: datetime, end: datetime):
+        """Milliseconds between start and end falling on each "yyyy-MM-dd" day"""
+        added = {}
         current = start
         while current.date() < end.date():
             # end of current day
-            dayEnd = QDateTime(current.date()).addDays(1)
-            elapsed = current.msecsTo(dayEnd)
-            dayStr = current.toString("yyyy-MM-dd")
-            self.dailyWork[dayStr] = self.dailyWork.get(dayStr, 0) + elapsed
+            dayEnd = datetime.combine(current.date() + timedelta(days=1), time())
+            added[current.strftime("%Y-%m-%d")] = (dayEnd - current) // timedelta(milliseconds=1)
             current = dayEnd
         # Add remaining time on last day
-        dayStr = current.toString("yyyy-MM-dd")
-        elapsed = current.msecsTo(end)
-        self.dailyWork[dayStr] = self.dailyWork.get(dayStr, 0) + elapsed
+        added[current.strftime("%Y-%m-%d")] = (end - current) // timedelta(milliseconds=1)
+        return added
+
+    def applyWork(self, days, elapsedMs = 0, startMs = None, endMs = None):
+        for dayStr, ms in days.items():
+            self.dailyWork[dayStr] = self.dailyWork.get(dayStr, 0) + ms
+        self._elapsedMs += elapsedMs
+        if startMs is not None:
+            # Checkpoints split one focus session into back to back spans, join them again
+            if self.sessions and self.sessions[-1][1] == startMs:
+                self.sessions[-1][1] = endMs
+            else:
+                self.sessions.append([startMs, endMs])
 
     def isFinished(self):
         return self.elapsedTimeMs >= self.durationMs
@@ -69,27 +145,34 @@ class Task(QObject):
         return int((self.elapsedTimeMs / self.durationMs) * 100)
     
     def getSaveData(self):
-        if self.active:
-            self.setFocused(False)
+        # Only committed time is saved, a running session is left untouched and
+        # reaches the journal through checkpoint()
         dailyHours = {day: ms / 1000 / 3600 for day, ms in self.dailyWork.items()}
         return {
+            "Id" : self.id,
             "Name" : self.name,
             "Show" : self.show,
             "Category" : self.categoryId,
             "Duration" : self.durationMs,
-            "Elapsed" : self.elapsedTimeMs,
+            "Elapsed" : self._elapsedMs,
             "DailyWork" : dailyHours,
+            "Sessions" : [list(session) for session in self.sessions],
         }
 
 
 def GetTaskFromData(data):
-    dailyWork = {day: int(hours * 3600 * 1000) for day, hours in data.get("DailyWork", {}).items()}
+    # Stores that keep milliseconds pass them as is, saves in hours are converted
+    dailyWork = data.get("DailyWorkMs")
+    if dailyWork is None:
+        dailyWork = {day: int(hours * 3600 * 1000) for day, hours in data.get("DailyWork", {}).items()}
 
     return Task(
+        taskId=data.get("Id"),
         name=data["Name"],
         show=data["Show"],
         categoryId=data["Category"],
         durationMs=data["Duration"],
         elapsedMs=data["Elapsed"],
         dailyWork=dailyWork,
+        sessions=data.get("Sessions", []),
     )
\ No newline at end of file
@@ -1,55 +1,223 @@
 from Scripts.Util.colors import COLORS, ColorHex
-from Scripts.Tasks.task import Task, GetTaskFromData
+from Scripts.Tasks.task import Task, GetTaskFromData, ObserveTasks
 
 
+class TaskSet:
+    """A category's tasks in insertion order, with O(1) add, remove and membership"""
+
+    def __init__(self, tasks=()):
+        self._tasks = dict.fromkeys(tasks)
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __contains__(self, task):
+        return task in self._tasks
+
+    def add(self, task):
+        self._tasks[task] = None
+
+    def remove(self, task):
+        del self._tasks[task]
+
 
 CATEGORIES = {
     1: {
         "Name": "None",
         "Description": "",
         "Color": COLORS.Blue,
-        "Tasks": [],
+        "Tasks": TaskSet(),
     },
 }
 
-def AddCategory(name, color=COLORS.Blue, description=""):
-    id = 0
-    while id in CATEGORIES.keys():
-        id += 1
-    
+# Callbacks of the form callback(event, data) told about every change to the data
+_LISTENERS = []
+_NEXT_TASK_ID = 1
+# Category ids are never reused, so time logged under a deleted category stays its own
+_NEXT_CATEGORY_ID = 2
+# Task id -> task over every category
+_TASKS = {}
+# Bumped whenever tasks are added, removed or reordered, invalidating GetTasks()
+_VERSION = 0
+_TASK_LIST = (None, [])
+
+
+def Subscribe(callback):
+    _LISTENERS.append(callback)
+
+def Unsubscribe(callback):
+    if callback in _LISTENERS:
+        _LISTENERS.remove(callback)
+
+def _Notify(event, **data):
+    for callback in list(_LISTENERS):
+        callback(event, data)
+
+
+def _AllocateTaskId():
+    global _NEXT_TASK_ID
+    taskId = _NEXT_TASK_ID
+    _NEXT_TASK_ID += 1
+    return taskId
+
+def _Changed():
+    global _VERSION
+    _VERSION += 1
+
+def _TrackTask(task: Task):
+    global _NEXT_TASK_ID
+    if task.id is None:
+        task.id = _AllocateTaskId()
+    else:
+        _NEXT_TASK_ID = max(_NEXT_TASK_ID, task.id + 1)
+    _TASKS[task.id] = task
+
+
+def _OnTaskSignal(name, task, *args):
+    # One observer for every task, so tracking a task creates no Qt objects
+    if name == "focused":
+        _Notify("TaskFocused", Id=task.id)
+    elif name == "unfocused":
+        _Notify("TaskUnfocused", Id=task.id)
+    elif name == "worked":
+        _Notify("TaskWorked", Id=task.id, Category=task.categoryId, **args[0])
+
+ObserveTasks(_OnTaskSignal)
+
+
+def AddCategory(name, color=COLORS.Blue, description="", categoryId=None):
+    global _NEXT_CATEGORY_ID
+    id = categoryId
+    if id is None:
+        id = _NEXT_CATEGORY_ID
+    _NEXT_CATEGORY_ID = max(_NEXT_CATEGORY_ID, id + 1)
+
     CATEGORIES[id] = {
         "Name": name,
         "Description": description,
         "Color": color,
-        "Tasks": [],
+        "Tasks": TaskSet(),
     }
+    _Notify("CategoryAdded", Id=id, Name=name, Description=description, Color=str(color))
 
     return id
 
 
+def EditCategory(id, name=None, description=None, color=None):
+    category = CATEGORIES[id]
+    changes = {}
+    if name is not None:
+        category["Name"] = changes["Name"] = name
+    if description is not None:
+        category["Description"] = changes["Description"] = description
+    if color is not None:
+        category["Color"] = color
+        changes["Color"] = str(color)
+    _Notify("CategoryEdited", Id=id, **changes)
+
+
+def DeleteCategory(id):
+    if id in CATEGORIES:
+        for task in CATEGORIES[id]["Tasks"]:
+            _TASKS.pop(task.id, None)
+        del CATEGORIES[id]
+        _Changed()
+        _Notify("CategoryDeleted", Id=id)
+
+
 def GetCategory(id):
     return CATEGORIES[id]
 
+def GetNextCategoryId():
+    """The id the next category gets, saved so ids of deleted categories stay retired"""
+    return _NEXT_CATEGORY_ID
+
 def GetTasks():
-    return [
-        task for category in CATEGORIES.values() for task in category["Tasks"]
-    ]
+    """Every task, category by category; the list is shared until the next change, so don't modify it"""
+    global _TASK_LIST
+    version, tasks = _TASK_LIST
+    if version != _VERSION:
+        tasks = [
+            task for category in CATEGORIES.values() for task in category["Tasks"]
+        ]
+        _TASK_LIST = (_VERSION, tasks)
+    return tasks
 
+def GetTask(taskId):
+    return _TASKS.get(taskId)
 
-def CreateTask(name, categoryId, durationMs):
-    newTask = Task(name=name, categoryId=categoryId, durationMs=durationMs)
+
+def CreateTask(name, categoryId, durationMs, taskId=None):
+    newTask = Task(name=name, categoryId=categoryId, durationMs=durationMs, taskId=taskId)
+    _TrackTask(newTask)
     category = CATEGORIES[categoryId]
-    category["Tasks"].append(newTask)
+    category["Tasks"].add(newTask)
+    _Changed()
+    _Notify("TaskCreated", Id=newTask.id, Name=name, Category=categoryId, Duration=durationMs)
     return newTask
-    
+
+
+def EditTask(task: Task, name=None, durationMs=None, show=None, elapsedMs=None):
+    changes = {}
+    if name is not None:
+        task.name = changes["Name"] = name
+    if durationMs is not None:
+        task.durationMs = changes["Duration"] = durationMs
+    if show is not None:
+        task.show = changes["Show"] = show
+    if elapsedMs is not None:
+        task.elapsedTimeMs = changes["Elapsed"] = elapsedMs
+    if changes:
+        _Notify("TaskEdited", Id=task.id, **changes)
+
 
 def ChangeTaskCategory(task: Task, newCategoryId):
     newCategory = CATEGORIES[newCategoryId]
     oldCategory = CATEGORIES[task.categoryId]
 
     oldCategory["Tasks"].remove(task)
-    newCategory["Tasks"].append(task)
+    newCategory["Tasks"].add(task)
+    oldCategoryId = task.categoryId
     task.categoryId = newCategoryId
+    _Changed()
+    _Notify("TaskMoved", Id=task.id, Category=newCategoryId, From=oldCategoryId)
+
+
+def DeleteTask(task: Task):
+    task.setFocused(False)
+    CATEGORIES[task.categoryId]["Tasks"].remove(task)
+    _TASKS.pop(task.id, None)
+    _Changed()
+    _Notify("TaskDeleted", Id=task.id, Category=task.categoryId)
+
+
+def ApplyEvent(event, data):
+    """Re-apply a change recorded by a listener, used when replaying the journal"""
+    if event == "CategoryAdded":
+        AddCategory(data["Name"], ColorHex(data["Color"]), data["Description"], categoryId=data["Id"])
+    elif event == "CategoryEdited":
+        color = ColorHex(data["Color"]) if "Color" in data else None
+        EditCategory(data["Id"], data.get("Name"), data.get("Description"), color)
+    elif event == "CategoryDeleted":
+        DeleteCategory(data["Id"])
+    elif event == "TaskCreated":
+        CreateTask(data["Name"], data["Category"], data["Duration"], taskId=data["Id"])
+    else:
+        task = GetTask(data["Id"])
+        if task is None:
+            return
+        if event == "TaskEdited":
+            EditTask(task, data.get("Name"), data.get("Duration"), data.get("Show"), data.get("Elapsed"))
+        elif event == "TaskMoved":
+            ChangeTaskCategory(task, data["Category"])
+        elif event == "TaskDeleted":
+            DeleteTask(task)
+        elif event == "TaskWorked":
+            task.applyWork(data["Days"], data["Elapsed"], data.get("Start"), data.get("End"))
+            _Notify("TaskWorked", **{**data, "Category": task.categoryId})
 
 
 def GetSaveData(categoryId):
@@ -67,16 +235,27 @@ def LoadFromData(categoryData):
         "Name": categoryData["Name"],
         "Description": categoryData["Description"],
         "Color": ColorHex(categoryData["Color"]),
-        "Tasks": [GetTaskFromData(taskData) for taskData in categoryData["Tasks"]],
+        "Tasks": TaskSet(GetTaskFromData(taskData) for taskData in categoryData["Tasks"]),
     }
 
 def SaveAll():
     categories = []
     for id in CATEGORIES.keys():
         categories.append(GetSaveData(id))
-    return categories
+    return {"NextCategoryId": _NEXT_CATEGORY_ID, "Categories": categories}
 
-def LoadAll(data):
+def LoadAll(data, nextCategoryId=0):
+    """Replace everything with saved categories; nextCategoryId is the saved GetNextCategoryId()"""
+    global _NEXT_TASK_ID, _NEXT_CATEGORY_ID
     CATEGORIES.clear()
+    _TASKS.clear()
+    _NEXT_TASK_ID = 1
     for categoryData in data:
-        LoadFromData(categoryData)
\ No newline at end of file
+        LoadFromData(categoryData)
+    _NEXT_CATEGORY_ID = max(nextCategoryId, max(CATEGORIES.keys(), default=0) + 1)
+    _Changed()
+    # Tasks saved before ids existed are numbered after the ones that have them
+    tasks = GetTasks()
+    for task in sorted(tasks, key=lambda t: t.id is None):
+        _TrackTask(task)
+    _Notify("Loaded")
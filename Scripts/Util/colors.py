@@ -1,10 +1,10 @@
-from PyQt6.QtGui import QColor
-
 class ColorHex:
     def __init__(self, hex_code: str):
         self.hex = hex_code
 
-    def toQColor(self) -> QColor:
+    def toQColor(self):
+        # Imported here so colors stay usable without Qt
+        from PyQt6.QtGui import QColor
         return QColor(self.hex)
 
     def __str__(self):
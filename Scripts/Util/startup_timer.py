@@ -0,0 +1,36 @@
+import sys
+import time
+
+from Scripts.Util.resource_path import resourcePath
+
+# Passing this on the command line writes the phase timings once the app is usable
+STARTUP_REPORT_FLAG = "--startup-report"
+# Where the report goes when there is no console, as in the --noconsole build
+STARTUP_REPORT_PATH = resourcePath("startupReport.txt")
+
+# Counted from the first import of this module, which main.py does before anything heavy
+_START = time.perf_counter()
+_PHASES = []  # (phase, seconds since _START)
+
+def MarkPhase(phase):
+    """Record that a startup phase has just finished"""
+    _PHASES.append((phase, time.perf_counter() - _START))
+
+def StartupReport():
+    lines = ["Startup phases (ms since launch, ms for the phase):"]
+    previous = 0
+    for phase, at in _PHASES:
+        lines.append(f"  {phase:<20}{at * 1000:9.1f}{(at - previous) * 1000:9.1f}")
+        previous = at
+    return "\n".join(lines)
+
+def WantsStartupReport():
+    return STARTUP_REPORT_FLAG in sys.argv
+
+def WriteStartupReport():
+    report = StartupReport()
+    if sys.stdout is not None:
+        print(report)
+    else:
+        with open(STARTUP_REPORT_PATH, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
@@ -1,23 +1,23 @@
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QComboBox, QLabel,
-    QScrollArea, QPushButton, QSizePolicy, QSplitter, QFrame
+    QPushButton, QSplitter, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QTimer
 from PyQt6.QtGui import QColor, QCursor
 from datetime import datetime
 from collections import defaultdict
 
-from Scripts.SupportUI.collapsable_category import CollapsibleCategory
+from Scripts.SupportUI.task_tree import TaskTreeView
 from Scripts.SupportUI.category_dialog import CategoryCreationWindow
 from Scripts.SupportUI.task_dialog import TaskCreationWindow 
-from Scripts.SupportUI.task_calendar import TaskAnalyticsChart
 from Scripts.Util.app_constructer import App
-from Scripts.Tasks.task_manager import CATEGORIES, AddCategory
+from Scripts.Tasks.task_manager import AddCategory
 import Scripts.Tasks.task_manager as task_manager
 
 MIN_SIDEBAR_WIDTH = 150
 MAX_SIDEBAR_WIDTH = 400
 DEFAULT_SIDEBAR_WIDTH = 250
+RANKING_PANEL_WIDTH = 260
 WIDTH = 1200
 HEIGHT = 700
 
@@ -137,26 +137,16 @@ class CollapsibleSidebar(QWidget):
             new_width = int(max(self.min_width, min(self.max_width, self.resize_start_width + delta_x)))
             self.sidebar_width = new_width
             self.setFixedWidth(new_width)
-            
-            # Notify category widgets of width change
-            self.update_category_widths()
     
     def end_resize(self, event):
         """End sidebar resizing"""
         self.resizing = False
     
-    def update_category_widths(self):
-        """Update width of all category widgets"""
-        for i in range(self.content_layout.count()):
-            item = self.content_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if hasattr(widget, 'update_width'):
-                    widget.update_width(self.sidebar_width - 30)  # Account for margins
-
 
 class LargeTaskView(QWidget):
     requestMiniView = pyqtSignal(QEvent)
+    # Emitted once the chart and ranking panel have been built
+    analyticsReady = pyqtSignal()
     
     def __init__(self, show=True):
         super().__init__()
@@ -192,6 +182,16 @@ class LargeTaskView(QWidget):
             QScrollArea > QWidget > QWidget {{
                 background-color: {self.bg_color};
             }}
+            QTreeView {{
+                border: 1px solid {self.lighten_color(self.bg_color, 40)};
+                border-radius: 4px;
+            }}
+            QTreeView::item {{
+                padding: 2px;
+            }}
+            QTreeView::item:selected {{
+                background-color: {self.lighten_color(self.bg_color, 20)};
+            }}
         """)
         
         self.mainLayout = QHBoxLayout(self)
@@ -206,13 +206,13 @@ class LargeTaskView(QWidget):
         self.content_area = QWidget()
         self.content_layout = QVBoxLayout(self.content_area)
         
-        # Add analytics chart
-        self.analyticsChart = TaskAnalyticsChart(
-            task_manager, 
-            background_color=self.bg_color, 
-            text_color=self.text_color
-        )
-        self.content_layout.addWidget(self.analyticsChart)
+        # The chart pulls in NumPy, the analytics indexes and a plotting library,
+        # so it is only built after the window has first been painted
+        self.analyticsChart = None
+        self.rankingPanel = None
+        self.analyticsPlaceholder = QLabel("Loading analytics…")
+        self.analyticsPlaceholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.content_layout.addWidget(self.analyticsPlaceholder)
         
         # Add to main layout
         self.mainLayout.addWidget(self.sidebar)
@@ -221,27 +221,44 @@ class LargeTaskView(QWidget):
         if show:
             self.show()
 
-    def setup_sidebar_content(self):
-        """Set up the sidebar with scrollable categories and buttons"""
-        # Scrollable area for categories
-        self.scrollArea = QScrollArea()
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scrollContent = QWidget()
-        self.scrollLayout = QVBoxLayout(self.scrollContent)
-        self.scrollLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scrollLayout.setSpacing(5)
-        self.scrollContent.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Maximum
-        )
+    def buildAnalytics(self):
+        """Import and build the analytics chart and the ranking panel beside it"""
+        if self.analyticsChart is not None:
+            return
+        from Scripts.SupportUI.task_calendar import TaskAnalyticsChart
+        from Scripts.SupportUI.ranking_panel import TaskRankingPanel
 
-        # Populate categories
-        self.categoryWidgets = []
-        self.populateCategories()
+        # Add analytics chart
+        self.analyticsChart = TaskAnalyticsChart(
+            task_manager, 
+            background_color=self.bg_color, 
+            text_color=self.text_color
+        )
+        
+        # Top tasks or categories over the chart's range, beside the chart
+        self.rankingPanel = TaskRankingPanel(
+            task_manager,
+            self.analyticsChart,
+            background_color=self.bg_color,
+            text_color=self.text_color
+        )
+        self.rankingPanel.setFixedWidth(RANKING_PANEL_WIDTH)
+        self.analyticsChart.chart_updated.connect(self.rankingPanel.refresh)
+        
+        self.content_layout.removeWidget(self.analyticsPlaceholder)
+        self.analyticsPlaceholder.deleteLater()
+        chart_row = QHBoxLayout()
+        chart_row.addWidget(self.analyticsChart, 1)
+        chart_row.addWidget(self.rankingPanel)
+        self.content_layout.addLayout(chart_row)
+        self.analyticsReady.emit()
 
-        self.scrollArea.setWidget(self.scrollContent)
-        self.sidebar.add_widget(self.scrollArea)
+    def setup_sidebar_content(self):
+        """Set up the sidebar with the category tree and buttons"""
+        # Only the visible rows of the tree are ever painted
+        self.taskTree = TaskTreeView()
+        self.taskTree.category_deleted.connect(self.on_category_deleted)
+        self.sidebar.add_widget(self.taskTree)
 
         # Buttons container
         buttons_container = QWidget()
@@ -278,51 +295,27 @@ class LargeTaskView(QWidget):
         return f"#{r:02x}{g:02x}{b:02x}"
 
     def populateCategories(self):
-        """Clear and populate all categories"""
-        # Clear existing widgets
-        for i in reversed(range(self.scrollLayout.count())):
-            widget = self.scrollLayout.takeAt(i).widget()
-            if widget:
-                widget.deleteLater()
-        self.categoryWidgets.clear()
-        
-        # Add category widgets
-        for catId, catData in CATEGORIES.items():
-            catWidget = CollapsibleCategory(catId, catData, self.sidebar.sidebar_width - 30)
-            catWidget.category_updated.connect(self.on_category_updated)
-            catWidget.category_deleted.connect(self.on_category_deleted)
-            self.scrollLayout.addWidget(catWidget)
-            self.categoryWidgets.append(catWidget)
-
-    def on_category_updated(self):
-        """Handle category updates"""
-        self.populateCategories()
-        self.refreshChart()
+        """Rebuild the category tree"""
+        self.taskTree.refresh()
 
     def on_category_deleted(self, category_id):
-        """Handle category deletion"""
-        if category_id in CATEGORIES:
-            del CATEGORIES[category_id]
-        self.populateCategories()
-        self.refreshChart()
+        """Handle category deletion, the tree and chart follow task_manager's events"""
+        task_manager.DeleteCategory(category_id)
 
     def createCategoryPopup(self):
         """Create a new category"""
         dialog = CategoryCreationWindow(self)
-        if dialog.exec():
-            self.populateCategories()
-            self.refreshChart()
+        dialog.exec()
 
     def createTaskPopup(self):
         """Create a new task"""
         dialog = TaskCreationWindow(self)
-        if dialog.exec():
-            self.populateCategories()
-            self.refreshChart()
+        dialog.exec()
 
     def refreshChart(self):
         """Refresh the analytics chart with current data"""
-        self.analyticsChart.refresh_data()
+        if self.analyticsChart is not None:
+            self.analyticsChart.refresh_data()
 
     def changeEvent(self, a0):
         """Handle window state changes"""
@@ -333,8 +326,12 @@ class LargeTaskView(QWidget):
 
     def showEvent(self, a0):
         """Handle window show events"""
-        self.populateCategories()
-        self.refreshChart()
+        # The tree is kept current by events, only the chart's "today" may have moved
+        if self.analyticsChart is None:
+            # Built once the event loop has painted the window, a fresh chart needs no refresh
+            QTimer.singleShot(0, self.buildAnalytics)
+        else:
+            self.refreshChart()
         return super().showEvent(a0)
 
     def set_theme(self, background_color, text_color):
@@ -369,10 +366,22 @@ class LargeTaskView(QWidget):
             QScrollArea > QWidget > QWidget {{
                 background-color: {background_color};
             }}
+            QTreeView {{
+                border: 1px solid {self.lighten_color(background_color, 40)};
+                border-radius: 4px;
+            }}
+            QTreeView::item {{
+                padding: 2px;
+            }}
+            QTreeView::item:selected {{
+                background-color: {self.lighten_color(background_color, 20)};
+            }}
         """)
         
-        # Update chart theme
-        self.analyticsChart.set_theme(background_color, text_color)
+        # Update chart theme, a chart built later picks up the colors itself
+        if self.analyticsChart is not None:
+            self.analyticsChart.set_theme(background_color, text_color)
+            self.rankingPanel.set_theme(background_color, text_color)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 # The window in the bottom right
-from Scripts.SupportUI.task_timer import TaskTimerBar
+from Scripts.SupportUI.task_timer import TaskBarList
 from Scripts.Util.app_constructer import App
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
@@ -29,9 +29,12 @@ class MiniTaskView(QWidget):
 
         self.mainLayout = QVBoxLayout(self)
 
-        self.taskLayout = QVBoxLayout()
-        # self.taskLayout.setSizeConstraint(QVBoxLayout.SizeConstraint.SetNoConstraint)
-        self.mainLayout.addLayout(self.taskLayout)
+        # All task bars are painted by this one widget, which keeps itself in
+        # sync with task_manager, so showing the window rebuilds nothing
+        self.taskList = TaskBarList(self)
+        self.taskList.setTasks(task for task in GetTasks() if task.show)
+        self.taskList.tasksChanged.connect(self.onTasksChanged)
+        self.mainLayout.addWidget(self.taskList)
         self.activeTask = None  # track active task
 
         self.menu_bar = self.buildMenuBar()
@@ -69,18 +72,13 @@ class MiniTaskView(QWidget):
         return menu_bar
     
     def createNewTask(self):
+        # The new task reaches the bars through task_manager's events
         dialog = TaskCreationWindow(self)
-        if dialog.exec():
-            # Task has already been added inside the dialog
-            self.addTask(dialog.newTask, False)
-            QTimer.singleShot(10, self.adjustSize)
-
+        dialog.exec()
 
-    def addTask(self, task, adjust):
-        taskBar = TaskTimerBar(parent=self, task=task)
-        self.taskLayout.addWidget(taskBar)
-        if adjust:
-            QTimer.singleShot(10, self.adjustSizeAndPosition)
+    def onTasksChanged(self):
+        if self.isVisible():
+            QTimer.singleShot(10, self.adjustSize)
 
 
     def setActiveTask(self, task: Task):
@@ -122,19 +120,7 @@ class MiniTaskView(QWidget):
     def openLargeView(self):
         self.requestLargeView.emit()
 
-    def clearTaskLayout(self):
-        while self.taskLayout.count():
-            item = self.taskLayout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
     def showEvent(self, a0):
-        self.clearTaskLayout()
-        for task in GetTasks():
-            if task.show:
-                self.addTask(task, adjust=False)
-
         QTimer.singleShot(10, self.adjustSizeAndPosition)
         return super().showEvent(a0)
 
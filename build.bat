@@ -6,7 +6,10 @@ rmdir /s /q dist
 REM Remove previous spec file
 if exist "Task Tracker.spec" del "Task Tracker.spec"
 
-REM Run PyInstaller
-pyinstaller --onefile --noconsole --name "Task Tracker" main.py
+REM Run PyInstaller, the chart renderers are imported by name so they are listed explicitly
+pyinstaller --onefile --noconsole --name "Task Tracker" ^
+    --hidden-import Scripts.SupportUI.mpl_chart_view ^
+    --hidden-import Scripts.SupportUI.pg_chart_view ^
+    main.py
 
 pause
@@ -1,42 +1,141 @@
+# Imported first so the startup phases are timed from launch
+from Scripts.Util.startup_timer import MarkPhase, WantsStartupReport, WriteStartupReport
+
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 
 import sys
 import json, gzip
 
 from Scripts.Util.resource_path import resourcePath
 from Scripts.large_task_view import LargeTaskView
-from Scripts.mini_task_view import MiniTaskView
-from Scripts.Tasks.task_manager import SaveAll, LoadAll
+from Scripts.Tasks.task_manager import LoadAll, Subscribe
+from Scripts.Tasks.journal import Journal, ReplayJournal
+from Scripts.Tasks.storage import STORAGE_BACKENDS, CreateStore, MigrateStore, StorageBackendFromArgs
+from Scripts.Tasks.clock import GetClock
+from Scripts.Tasks.qt_adapters import GetQtClock
 
 SAVE_PATH = resourcePath("taskSaveData.json")
+JOURNAL_PATH = resourcePath("taskSaveData.journal")
+
+# How often focused time is committed and the journal is synced to disk
+JOURNAL_FLUSH_INTERVAL_MS = 5000
+# How often changed categories are written back to their segments
+AUTOSAVE_INTERVAL_MS = 30000
+# Journal size past which an autosave is forced early
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+MarkPhase("imports")
 
 class TaskTrackerApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
-        try:
-            with gzip.open(SAVE_PATH + ".gz", "rt", encoding="utf-8") as f:
-                data = json.load(f)
-                LoadAll(data)
-        except FileNotFoundError:
-            pass
+        # Focused tasks tick on the Qt event loop
+        GetQtClock()
+        MarkPhase("QApplication")
+        self.storageBackend = StorageBackendFromArgs(sys.argv)
+        self.store = CreateStore(self.storageBackend)
+        seq = self.store.load()
+        if seq is None:
+            seq = self.migrateOtherStore()
+        if seq is None:
+            seq = self.loadLegacySnapshot()
+            self.store.markAllDirty()
+        Subscribe(self.store.onEvent)
+
+        self.journal = Journal(JOURNAL_PATH, ReplayJournal(JOURNAL_PATH, seq))
+        Subscribe(self.journal.record)
+        MarkPhase("data loaded")
+
+        self.journalTimer = QTimer()
+        self.journalTimer.timeout.connect(self.flushJournal)
+        self.journalTimer.start(JOURNAL_FLUSH_INTERVAL_MS)
+
+        self.autosaveTimer = QTimer()
+        self.autosaveTimer.timeout.connect(self.autosave)
+        self.autosaveTimer.start(AUTOSAVE_INTERVAL_MS)
 
+        # Runs on the first turn of the event loop, once the window has been shown
+        QTimer.singleShot(0, lambda: MarkPhase("usable"))
+        # The large view builds its analytics after its first paint, the mini view
+        # is only built the first time it is opened
         self.mainWindow = LargeTaskView()
-        self.miniWindow = MiniTaskView(show=False)
+        self.mainWindow.analyticsReady.connect(self.onAnalyticsReady)
+        self.miniWindow = None
 
         self.mainWindow.requestMiniView.connect(self.openMiniWindow)
-        self.miniWindow.requestLargeView.connect(self.openLargeWindow)
+        MarkPhase("windows built")
 
     def run(self):
         self.app.aboutToQuit.connect(self.saveData)
         sys.exit(self.app.exec())
 
+    def migrateOtherStore(self):
+        """Copy the save of another backend into an empty store once, None if there is none"""
+        for backend in STORAGE_BACKENDS:
+            if backend == self.storageBackend:
+                continue
+            source = CreateStore(backend)
+            seq = MigrateStore(source, self.store)
+            source.close()
+            if seq is not None:
+                return seq
+        return None
+
+    def loadLegacySnapshot(self):
+        """Load the single-file snapshot used before segmented saves"""
+        seq = 0
+        try:
+            with gzip.open(SAVE_PATH + ".gz", "rt", encoding="utf-8") as f:
+                data = json.load(f)
+                # Snapshots written before the journal existed are a bare list
+                nextCategoryId = 0
+                if isinstance(data, dict):
+                    seq = data["Seq"]
+                    nextCategoryId = data.get("NextCategoryId", 0)
+                    data = data["Categories"]
+                LoadAll(data, nextCategoryId)
+        except FileNotFoundError:
+            pass
+        return seq
+
+    def flushJournal(self):
+        for task in GetClock().activeTasks:
+            task.checkpoint()
+        self.journal.flush()
+        if self.journal.size() > JOURNAL_COMPACT_BYTES:
+            self.autosave()
+
+    def autosave(self):
+        """Write only the changed categories; a running task keeps running"""
+        self.journal.flush()
+        if self.store.isDirty():
+            self.store.save(self.journal.seq)
+        # Everything journaled so far is now covered by the saved segments
+        if self.journal.size():
+            self.journal.reset()
+
     def saveData(self):
-        with gzip.open(SAVE_PATH + ".gz", "wt", encoding="utf-8") as f:
-            json.dump(SaveAll(), f, separators=(",", ":"))
-        
+        self.journalTimer.stop()
+        self.autosaveTimer.stop()
+        for task in list(GetClock().activeTasks):
+            task.setFocused(False)
+        self.autosave()
+        self.journal.close()
+        self.store.close()
+
+    def onAnalyticsReady(self):
+        MarkPhase("analytics built")
+        if WantsStartupReport():
+            WriteStartupReport()
+
     def openMiniWindow(self, a0):
         a0.ignore()
         self.mainWindow.hide()
+        if self.miniWindow is None:
+            from Scripts.mini_task_view import MiniTaskView
+            self.miniWindow = MiniTaskView(show=False)
+            self.miniWindow.requestLargeView.connect(self.openLargeWindow)
         self.miniWindow.show()
 
     def openLargeWindow(self):